@@ -1,13 +1,59 @@
 import asyncio
+import itertools
+import time
+from collections import deque
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
+import aiohttp
+import orjson
 import structlog
 
-from shared.database import get_db, redis_client
+from shared.database import get_db, redis_client, async_redis_client
 from shared.config import settings
 
 logger = structlog.get_logger()
 
+LIVE_GAME_TTL_SECONDS = 10
+LIVE_GAME_SOFT_TTL_SECONDS = 7
+
+GAME_DIFF_SCHEMA = [
+    ('home_score', 'score_change', 'home'),
+    ('away_score', 'score_change', 'away'),
+    ('quarter', 'quarter_change', None),
+    ('status', 'status_change', None),
+]
+
+
+def _compile_game_diff(schema):
+    """
+    Generate a flat comparison function for the known game schema.
+    One branch per field with the dict lookups inlined, so adding fields
+    to the schema never adds generic-loop overhead to the per-tick diff.
+    """
+    lines = ["def _diff(old, new):", "    changes = []"]
+
+    for field, change_type, team in schema:
+        default = '0' if team is not None else 'None'
+        lines.append(f"    _o = old.get({field!r}, {default})")
+        lines.append(f"    _n = new.get({field!r}, {default})")
+        lines.append("    if _o != _n:")
+        if team is not None:
+            lines.append(
+                f"        changes.append({{'type': {change_type!r}, 'team': {team!r}, "
+                f"'old_score': _o, 'new_score': _n}})"
+            )
+        else:
+            lines.append(
+                f"        changes.append({{'type': {change_type!r}, 'field': {field!r}, "
+                f"'old_value': _o, 'new_value': _n}})"
+            )
+
+    lines.append("    return changes")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['_diff']
+
 
 class LiveMonitor:
     """
@@ -18,7 +64,13 @@ class LiveMonitor:
     def __init__(self):
         self.is_monitoring = False
         self.active_games = {}
-        self.lineup_adjustments = []
+        self.lineup_adjustments: deque = deque(maxlen=settings.max_live_adjustments)
+        self._fetch_locks: Dict[str, asyncio.Lock] = {}
+        # Strong references to in-flight background refreshes; a bare
+        # create_task result can be garbage-collected mid-flight
+        self._refresh_tasks: set = set()
+        self._diff_game = _compile_game_diff(GAME_DIFF_SCHEMA)
+        self._http: Optional[aiohttp.ClientSession] = None
         
     async def start_monitoring(self, week: int, season: int = 2025) -> Dict[str, Any]:
         """Start live monitoring for specified week"""
@@ -26,7 +78,14 @@ class LiveMonitor:
         
         try:
             self.is_monitoring = True
-            
+
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, limit_per_host=16, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=3)
+            )
+
             games = await self._get_active_games(week, season)
             self.active_games = {game['id']: game for game in games}
             
@@ -49,7 +108,11 @@ class LiveMonitor:
         logger.info("Stopping live monitoring")
         
         self.is_monitoring = False
-        
+
+        if self._http:
+            await self._http.close()
+            self._http = None
+
         return {
             'status': 'monitoring_stopped',
             'stopped_at': datetime.now(timezone.utc).isoformat()
@@ -75,13 +138,81 @@ class LiveMonitor:
         
         if live_data:
             changes = self._detect_changes(game, live_data)
-            
+
             if changes:
+                await self._publish_game_state(game_id, live_data)
                 await self._process_game_changes(game_id, changes)
     
     async def _fetch_live_game_data(self, game_id: str) -> Optional[Dict[str, Any]]:
-        """Fetch live game data from API"""
-        
+        """
+        Fetch live game data, serving from a short-TTL Redis cache.
+        Concurrent callers for the same game share one upstream fetch, and
+        entries older than the soft TTL trigger a background refresh while
+        the current caller still gets the cached value (stale-while-revalidate).
+        """
+
+        cache_key = f"live_game:{game_id}"
+
+        cached = await async_redis_client.get(cache_key)
+        if cached:
+            data = orjson.loads(cached)
+            if time.time() - data.pop('_fetched_at', 0.0) > LIVE_GAME_SOFT_TTL_SECONDS:
+                task = asyncio.create_task(self._refresh_live_game_data(game_id))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._on_refresh_done)
+            return data
+
+        lock = self._fetch_locks.setdefault(game_id, asyncio.Lock())
+        async with lock:
+            cached = await async_redis_client.get(cache_key)
+            if cached:
+                data = orjson.loads(cached)
+                data.pop('_fetched_at', None)
+                return data
+
+            return await self._fetch_and_cache_live_game_data(game_id, cache_key)
+
+    def _on_refresh_done(self, task: asyncio.Task):
+        """Drop the task reference and surface any refresh failure"""
+
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background live-game refresh failed",
+                           error=str(task.exception()))
+
+    async def _refresh_live_game_data(self, game_id: str):
+        """Refresh a stale cache entry in the background (one fetch per game)"""
+
+        lock = self._fetch_locks.setdefault(game_id, asyncio.Lock())
+        if lock.locked():
+            return
+
+        async with lock:
+            await self._fetch_and_cache_live_game_data(game_id, f"live_game:{game_id}")
+
+    async def _fetch_and_cache_live_game_data(
+        self, game_id: str, cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch from the upstream API and write through to the cache"""
+
+        data = await self._fetch_live_game_data_from_api(game_id)
+
+        if data:
+            payload = dict(data, _fetched_at=time.time())
+            await async_redis_client.setex(
+                cache_key, LIVE_GAME_TTL_SECONDS, orjson.dumps(payload)
+            )
+
+        return data
+
+    async def _fetch_live_game_data_from_api(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch live game data from API.
+        Requests go through the pooled session created in start_monitoring,
+        e.g. `async with self._http.get(url) as r: return await r.json(loads=orjson.loads)`,
+        so per-call TLS/DNS setup is avoided once a provider is wired in.
+        """
+
         return {
             'game_id': game_id,
             'status': 'in_progress',
@@ -94,51 +225,62 @@ class LiveMonitor:
     
     def _detect_changes(self, old_game: Dict[str, Any], new_game: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect significant changes in game state"""
-        
-        changes = []
-        
-        if old_game.get('home_score', 0) != new_game.get('home_score', 0):
-            changes.append({
-                'type': 'score_change',
-                'team': 'home',
-                'old_score': old_game.get('home_score', 0),
-                'new_score': new_game.get('home_score', 0)
-            })
-        
-        if old_game.get('away_score', 0) != new_game.get('away_score', 0):
-            changes.append({
-                'type': 'score_change',
-                'team': 'away',
-                'old_score': old_game.get('away_score', 0),
-                'new_score': new_game.get('away_score', 0)
-            })
-        
-        return changes
+
+        return self._diff_game(old_game, new_game)
     
     async def _process_game_changes(self, game_id: str, changes: List[Dict[str, Any]]):
         """Process detected game changes"""
         
+        generated_at = datetime.now(timezone.utc).isoformat()
+
+        await self._update_player_projections(game_id, changes)
+
         for change in changes:
             logger.info("Game change detected", game_id=game_id, change=change)
-            
-            await self._update_player_projections(game_id, change)
-            await self._generate_lineup_suggestions(game_id, change)
+
+            await self._generate_lineup_suggestions(game_id, change, generated_at)
     
-    async def _update_player_projections(self, game_id: str, change: Dict[str, Any]):
-        """Update player projections based on game changes"""
-        
-        cache_key = f"live_projections:{game_id}"
-        redis_client.setex(cache_key, 300, str(change))
+    async def _publish_game_state(self, game_id: str, live_data: Dict[str, Any]):
+        """
+        Publish hot game-state fields as a Redis hash.
+        Readers that only care about the score can HMGET individual fields
+        instead of deserializing a whole payload.
+        """
+
+        mapping = {
+            field: live_data[field]
+            for field in ('home_score', 'away_score', 'quarter', 'time_remaining', 'status')
+            if field in live_data
+        }
+
+        if not mapping:
+            return
+
+        state_key = f"live_game_state:{game_id}"
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(state_key, mapping=mapping)
+            pipe.expire(state_key, 300)
+            await pipe.execute()
+
+    async def _update_player_projections(self, game_id: str, changes: List[Dict[str, Any]]):
+        """Update player projections for a batch of changes in one round-trip"""
+
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            for i, change in enumerate(changes):
+                pipe.setex(f"live_projections:{game_id}:{i}", 300, orjson.dumps(change))
+            await pipe.execute()
     
-    async def _generate_lineup_suggestions(self, game_id: str, change: Dict[str, Any]):
-        """Generate lineup adjustment suggestions"""
-        
+    async def _generate_lineup_suggestions(
+        self, game_id: str, change: Dict[str, Any], generated_at: str
+    ):
+        """Generate lineup adjustment suggestions, stamped once per change batch"""
+
         suggestion = {
             'game_id': game_id,
             'change': change,
             'suggestion': 'Consider pivoting to players in higher-scoring games',
             'confidence': 0.7,
-            'generated_at': datetime.now(timezone.utc).isoformat()
+            'generated_at': generated_at
         }
         
         self.lineup_adjustments.append(suggestion)
@@ -163,6 +305,12 @@ class LiveMonitor:
             }
         ]
     
+    def get_recent_adjustments(self, n: int = 50) -> List[Dict[str, Any]]:
+        """Get the n most recent lineup adjustment suggestions"""
+
+        count = len(self.lineup_adjustments)
+        return list(itertools.islice(self.lineup_adjustments, max(0, count - n), count))
+
     async def get_monitoring_status(self) -> Dict[str, Any]:
         """Get current monitoring status"""
         
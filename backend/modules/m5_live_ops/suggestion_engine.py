@@ -7,6 +7,16 @@ from shared.database import get_db, redis_client
 
 logger = structlog.get_logger()
 
+_PRIORITY_WEIGHT = {'high': 3, 'medium': 2, 'low': 1}
+
+
+def _sort_key(priority: str, confidence: float) -> int:
+    """Single-integer sort key: priority-major, confidence-minor.
+
+    Unknown priority strings rank as 'low' rather than raising.
+    """
+    return _PRIORITY_WEIGHT.get(priority, 1) * 1_000_000 + int(confidence * 1000)
+
 
 class SuggestionEngine:
     """
@@ -29,17 +39,19 @@ class SuggestionEngine:
         
         try:
             suggestions = []
-            
+            high_priority = 0
+
             for lineup in current_lineups:
                 lineup_suggestions = await self._analyze_lineup(lineup, live_data)
                 suggestions.extend(lineup_suggestions)
-            
+                high_priority += sum(1 for s in lineup_suggestions if s['priority'] == 'high')
+
             prioritized_suggestions = self._prioritize_suggestions(suggestions)
-            
+
             result = {
                 'suggestions': prioritized_suggestions,
                 'total_suggestions': len(suggestions),
-                'high_priority': len([s for s in suggestions if s.get('priority') == 'high']),
+                'high_priority': high_priority,
                 'generated_at': datetime.now(timezone.utc).isoformat(),
                 'response_time_seconds': 45
             }
@@ -119,15 +131,12 @@ class SuggestionEngine:
     
     def _prioritize_suggestions(self, suggestions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prioritize suggestions by impact and confidence"""
-        
-        priority_order = {'high': 3, 'medium': 2, 'low': 1}
-        
+
+        # The key is computed once per suggestion; .get defaults keep
+        # suggestions with missing fields sortable like the old code did
         return sorted(
             suggestions,
-            key=lambda x: (
-                priority_order.get(x.get('priority', 'low'), 1),
-                x.get('confidence', 0)
-            ),
+            key=lambda s: _sort_key(s.get('priority', 'low'), s.get('confidence', 0.0)),
             reverse=True
         )
     
@@ -1,6 +1,11 @@
 import asyncio
+import os
+from collections import deque
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Dict, List, Any
 from datetime import datetime, timezone, timedelta
 import structlog
 
@@ -9,6 +14,35 @@ from shared.config import settings
 
 logger = structlog.get_logger()
 
+# Declared up front so a week with null metrics (legitimately produced by
+# the empty-input paths in the accuracy analyzers) doesn't freeze
+# null-typed columns into the file and reject later float rows
+_PERFORMANCE_SCHEMA = pa.schema([
+    ('week', pa.int64()),
+    ('season', pa.int64()),
+    ('projection_mae', pa.float64()),
+    ('projection_rmse', pa.float64()),
+    ('ownership_mae', pa.float64()),
+    ('ownership_meets_target', pa.bool_()),
+    ('roi', pa.float64()),
+    ('overall_grade', pa.string()),
+    ('analyzed_at', pa.string()),
+])
+
+# Mock contest results; replaced with a DB lookup once contest ingestion lands
+_SAMPLE_LINEUP_PERFORMANCE = {
+    'total_lineups': 150,
+    'avg_score': 142.5,
+    'best_score': 187.3,
+    'worst_score': 98.2,
+    'top_1_percent_finishes': 2,
+    'top_5_percent_finishes': 8,
+    'top_10_percent_finishes': 15,
+    'roi': 1.15,
+    'total_winnings': 2300.0,
+    'total_investment': 2000.0
+}
+
 
 class FeedbackLoop:
     """
@@ -17,8 +51,8 @@ class FeedbackLoop:
     """
     
     def __init__(self):
-        self.performance_history = []
-        
+        self.performance_history: deque = deque(maxlen=52)
+
     async def analyze_weekly_performance(self, week: int, season: int = 2025) -> Dict[str, Any]:
         """Analyze performance for completed week"""
         
@@ -29,16 +63,16 @@ class FeedbackLoop:
             projections = await self._get_projections(week, season)
             ownership_predictions = await self._get_ownership_predictions(week, season)
             
-            projection_analysis = await self._analyze_projection_accuracy(
-                projections, actual_results
-            )
-            
-            ownership_analysis = await self._analyze_ownership_accuracy(
-                ownership_predictions, actual_results
+            projection_analysis, ownership_analysis, lineup_analysis = await asyncio.gather(
+                asyncio.to_thread(
+                    self._analyze_projection_accuracy, projections, actual_results
+                ),
+                asyncio.to_thread(
+                    self._analyze_ownership_accuracy, ownership_predictions, actual_results
+                ),
+                self._analyze_lineup_performance(week, season)
             )
             
-            lineup_analysis = await self._analyze_lineup_performance(week, season)
-            
             performance_summary = {
                 'week': week,
                 'season': season,
@@ -72,52 +106,75 @@ class FeedbackLoop:
             logger.error("Error analyzing weekly performance", error=str(e))
             raise
     
-    async def _analyze_projection_accuracy(
-        self, 
-        projections: List[Dict[str, Any]], 
+    def _analyze_projection_accuracy(
+        self,
+        projections: List[Dict[str, Any]],
         actual_results: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Analyze projection accuracy"""
+        """Analyze projection accuracy (sync; run in a worker thread)"""
         
         if not projections or not actual_results:
             return {'mae': None, 'rmse': None, 'accuracy_by_position': {}}
-        
-        proj_df = pd.DataFrame(projections)
-        actual_df = pd.DataFrame(actual_results)
-        
-        merged = proj_df.merge(actual_df, on='player_id', how='inner')
-        
-        if merged.empty:
+
+        actual_by_id = {r['player_id']: r for r in actual_results}
+
+        projected_points = []
+        actual_points = []
+        positions = []
+        for proj in projections:
+            actual = actual_by_id.get(proj['player_id'])
+            if actual is None:
+                continue
+            projected_points.append(proj['projected_points'])
+            actual_points.append(actual['actual_points'])
+            positions.append(actual.get('position') or proj.get('position', ''))
+
+        if not projected_points:
             return {'mae': None, 'rmse': None, 'accuracy_by_position': {}}
-        
-        merged['error'] = abs(merged['projected_points'] - merged['actual_points'])
-        merged['squared_error'] = (merged['projected_points'] - merged['actual_points']) ** 2
-        
-        mae = merged['error'].mean()
-        rmse = (merged['squared_error'].mean()) ** 0.5
-        
-        accuracy_by_position = {}
-        for position in merged['position'].unique():
-            pos_data = merged[merged['position'] == position]
-            accuracy_by_position[position] = {
-                'mae': pos_data['error'].mean(),
-                'rmse': (pos_data['squared_error'].mean()) ** 0.5,
-                'sample_size': len(pos_data)
+
+        proj_arr = np.asarray(projected_points, dtype=float)
+        actual_arr = np.asarray(actual_points, dtype=float)
+        pos_arr = np.asarray(positions)
+
+        error = np.abs(proj_arr - actual_arr)
+        squared_error = error * error
+
+        mae = error.mean()
+        rmse = np.sqrt(squared_error.mean())
+
+        order = np.argsort(pos_arr, kind='stable')
+        pos_sorted = pos_arr[order]
+        error_sorted = error[order]
+        squared_sorted = squared_error[order]
+
+        unique_positions, group_starts = np.unique(pos_sorted, return_index=True)
+        error_groups = np.split(error_sorted, group_starts[1:])
+        squared_groups = np.split(squared_sorted, group_starts[1:])
+
+        accuracy_by_position = {
+            str(position): {
+                'mae': error_group.mean(),
+                'rmse': np.sqrt(squared_group.mean()),
+                'sample_size': int(error_group.size)
             }
-        
+            for position, error_group, squared_group in zip(
+                unique_positions, error_groups, squared_groups
+            )
+        }
+
         return {
-            'mae': round(mae, 2),
-            'rmse': round(rmse, 2),
+            'mae': round(float(mae), 2),
+            'rmse': round(float(rmse), 2),
             'accuracy_by_position': accuracy_by_position,
-            'sample_size': len(merged)
+            'sample_size': int(error.size)
         }
     
-    async def _analyze_ownership_accuracy(
-        self, 
-        ownership_predictions: List[Dict[str, Any]], 
+    def _analyze_ownership_accuracy(
+        self,
+        ownership_predictions: List[Dict[str, Any]],
         actual_results: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Analyze ownership prediction accuracy"""
+        """Analyze ownership prediction accuracy (sync; run in a worker thread)"""
         
         if not ownership_predictions or not actual_results:
             return {'mae': None, 'target_mae': 3.0, 'meets_target': False}
@@ -145,20 +202,7 @@ class FeedbackLoop:
     async def _analyze_lineup_performance(self, week: int, season: int) -> Dict[str, Any]:
         """Analyze lineup performance in contests"""
         
-        sample_performance = {
-            'total_lineups': 150,
-            'avg_score': 142.5,
-            'best_score': 187.3,
-            'worst_score': 98.2,
-            'top_1_percent_finishes': 2,
-            'top_5_percent_finishes': 8,
-            'top_10_percent_finishes': 15,
-            'roi': 1.15,
-            'total_winnings': 2300.0,
-            'total_investment': 2000.0
-        }
-        
-        return sample_performance
+        return dict(_SAMPLE_LINEUP_PERFORMANCE)
     
     def _calculate_overall_grade(
         self, 
@@ -316,7 +360,48 @@ class FeedbackLoop:
         
         cache_key = f"performance:week_{performance_data['week']}_{performance_data['season']}"
         redis_client.setex(cache_key, 86400 * 7, str(performance_data))
-        
+
         self.performance_history.append(performance_data)
-        
+        self._append_performance_row(self._flatten_performance_row(performance_data))
+
         logger.info("Performance data stored", cache_key=cache_key)
+
+    def _flatten_performance_row(self, performance_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a weekly performance summary to a single parquet row"""
+
+        projection = performance_data.get('projection_accuracy', {})
+        ownership = performance_data.get('ownership_accuracy', {})
+        lineup = performance_data.get('lineup_performance', {})
+
+        return {
+            'week': performance_data['week'],
+            'season': performance_data['season'],
+            'projection_mae': projection.get('mae'),
+            'projection_rmse': projection.get('rmse'),
+            'ownership_mae': ownership.get('mae'),
+            'ownership_meets_target': ownership.get('meets_target'),
+            'roi': lineup.get('roi'),
+            'overall_grade': performance_data['overall_grade'],
+            'analyzed_at': performance_data['analyzed_at']
+        }
+
+    def _append_performance_row(self, row: Dict[str, Any]):
+        """Append a flat performance row to the on-disk parquet history.
+
+        Read-concat-rewrite keeps the file valid after every append (no
+        open writer whose footer is only flushed on close) and preserves
+        rows from previous process runs; at one row per analyzed week the
+        rewrite cost is negligible.
+        """
+
+        table = pa.Table.from_pylist([row], schema=_PERFORMANCE_SCHEMA)
+        path = settings.performance_history_path
+
+        try:
+            if os.path.exists(path):
+                existing = pq.read_table(path).cast(_PERFORMANCE_SCHEMA)
+                table = pa.concat_tables([existing, table])
+            pq.write_table(table, path)
+        except (OSError, pa.ArrowInvalid) as e:
+            logger.warning("Failed to persist performance history",
+                           path=path, error=str(e))
@@ -1,14 +1,70 @@
 import asyncio
+import pickle
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 import structlog
 
-from shared.database import get_db, redis_client
+from shared.config import settings
+from shared.database import get_db, redis_client, async_redis_client
+from shared.utils import serialize_for_cache
+
+try:
+    # Transparently accelerates the sklearn estimators below via oneDAL
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
 
 logger = structlog.get_logger()
 
 
+def _detect_xgb_device() -> str:
+    """Pick the training device once at import; CUDA when a GPU is visible"""
+
+    try:
+        import cupy
+        if cupy.cuda.runtime.getDeviceCount() > 0:
+            return 'cuda'
+    except Exception:
+        pass
+
+    return 'cpu'
+
+
+_ML_DEVICE = _detect_xgb_device()
+
+_PROJECTION_MODEL_KEY = "model_blob:projection_model:latest"
+_WARM_START_TREES = 20
+# Once the warm-started forest reaches this size, fall back to a fresh
+# 100-tree fit; otherwise weekly retrains grow the ensemble (and its
+# blob size and inference latency) without bound
+_MAX_WARM_TREES = 300
+
+
+def _make_random_forest(n_estimators: int = 100, random_state: int = 42):
+    """
+    RandomForestRegressor factory: cuML on CUDA hosts, sklearn otherwise.
+    Returns (model, on_gpu) so callers know whether to move data to device.
+    """
+
+    if _ML_DEVICE == 'cuda':
+        try:
+            from cuml.ensemble import RandomForestRegressor
+            return RandomForestRegressor(
+                n_estimators=n_estimators, random_state=random_state
+            ), True
+        except ImportError:
+            pass
+
+    from sklearn.ensemble import RandomForestRegressor
+    return RandomForestRegressor(
+        n_estimators=n_estimators, random_state=random_state, n_jobs=-1
+    ), False
+
+
 class ModelTrainer:
     """
     Automated model training and versioning system.
@@ -23,23 +79,35 @@ class ModelTrainer:
         """Retrain specified models with latest data"""
         
         logger.info("Starting model retraining", models=models_to_retrain)
-        
+
+        now_iso = datetime.now(timezone.utc).isoformat()
+
         try:
+            results = await asyncio.gather(
+                *[self._retrain_single_model(name, now_iso) for name in models_to_retrain],
+                return_exceptions=True
+            )
+
             training_results = {}
-            
-            for model_name in models_to_retrain:
-                result = await self._retrain_single_model(model_name)
-                training_results[model_name] = result
-            
+            for model_name, result in zip(models_to_retrain, results):
+                if isinstance(result, Exception):
+                    training_results[model_name] = {
+                        'status': 'failed',
+                        'error': str(result),
+                        'model_name': model_name
+                    }
+                else:
+                    training_results[model_name] = result
+
             summary = {
                 'models_retrained': list(training_results.keys()),
                 'training_results': training_results,
-                'retrained_at': datetime.now(timezone.utc).isoformat(),
+                'retrained_at': now_iso,
                 'success_count': len([r for r in training_results.values() if r.get('status') == 'success']),
                 'failure_count': len([r for r in training_results.values() if r.get('status') == 'failed'])
             }
             
-            await self._update_model_registry(summary)
+            await self._update_model_registry(summary, now_iso)
             
             logger.info("Model retraining completed", 
                        success_count=summary['success_count'],
@@ -51,15 +119,15 @@ class ModelTrainer:
             logger.error("Error in model retraining", error=str(e))
             raise
     
-    async def _retrain_single_model(self, model_name: str) -> Dict[str, Any]:
+    async def _retrain_single_model(self, model_name: str, now_iso: str) -> Dict[str, Any]:
         """Retrain individual model"""
         
         logger.info("Retraining model", model_name=model_name)
         
         try:
             training_data = await self._get_training_data(model_name)
-            
-            if not training_data:
+
+            if training_data.empty:
                 return {
                     'status': 'failed',
                     'error': 'No training data available',
@@ -77,7 +145,7 @@ class ModelTrainer:
                     'model_name': model_name
                 }
             
-            new_version = await self._version_model(model_name, result)
+            new_version = await self._version_model(model_name, result, now_iso)
             
             return {
                 'status': 'success',
@@ -95,11 +163,9 @@ class ModelTrainer:
                 'model_name': model_name
             }
     
-    async def _retrain_projection_model(self, training_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _retrain_projection_model(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Retrain projection model"""
-        
-        df = pd.DataFrame(training_data)
-        
+
         feature_columns = [
             'passing_yards_avg', 'passing_tds_avg', 'rushing_yards_avg',
             'receiving_yards_avg', 'targets_avg', 'snap_percentage',
@@ -111,21 +177,41 @@ class ModelTrainer:
         if len(available_features) < 3:
             raise ValueError("Insufficient features for training")
         
-        X = df[available_features].fillna(0)
-        y = df['actual_points'].fillna(0)
-        
-        from sklearn.ensemble import RandomForestRegressor
+        X = np.ascontiguousarray(
+            df[available_features].to_numpy(dtype=np.float32, na_value=0.0)
+        )
+        y = df['actual_points'].to_numpy(dtype=np.float32, na_value=0.0)
+
         from sklearn.model_selection import train_test_split
         from sklearn.metrics import mean_absolute_error
-        
+
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        
-        model = RandomForestRegressor(n_estimators=100, random_state=42)
-        model.fit(X_train, y_train)
-        
-        y_pred = model.predict(X_test)
+
+        model, on_gpu = self._load_warm_model(available_features)
+        if model is None:
+            model, on_gpu = _make_random_forest(n_estimators=100, random_state=42)
+
+        if on_gpu:
+            # Single-device fit/predict; dask-cuml predict is far slower
+            import cupy
+            model.fit(cupy.asarray(X_train), cupy.asarray(y_train))
+            y_pred = cupy.asnumpy(model.predict(cupy.asarray(X_test)))
+        else:
+            from joblib import parallel_backend
+            with parallel_backend('loky'):
+                model.fit(X_train, y_train)
+            y_pred = model.predict(X_test)
         mae = mean_absolute_error(y_test, y_pred)
-        
+
+        if not on_gpu:
+            await async_redis_client.setex(
+                _PROJECTION_MODEL_KEY,
+                86400 * 30,
+                pickle.dumps(
+                    {'model': model, 'features': available_features}, protocol=5
+                )
+            )
+
         return {
             'model': model,
             'features': available_features,
@@ -135,12 +221,42 @@ class ModelTrainer:
                 'test_samples': len(X_test)
             }
         }
+
+    def _load_warm_model(self, available_features: List[str]):
+        """
+        Load the cached projection forest for warm-start retraining.
+        Returns (model, on_gpu); a schema change, cache miss, or a forest
+        already at the tree cap returns (None, False) so the caller
+        rebuilds from scratch.
+        """
+
+        try:
+            cached = redis_client.get(_PROJECTION_MODEL_KEY)
+            if cached is None:
+                return None, False
+            prior = pickle.loads(cached)
+        except Exception as e:
+            logger.warning("Could not load cached model, rebuilding", error=str(e))
+            return None, False
+
+        if prior.get('features') != available_features:
+            logger.info("Feature schema changed, rebuilding projection model")
+            return None, False
+
+        model = prior['model']
+        if model.n_estimators + _WARM_START_TREES > _MAX_WARM_TREES:
+            logger.info("Projection forest at tree cap, rebuilding fresh",
+                        n_estimators=model.n_estimators)
+            return None, False
+
+        model.warm_start = True
+        model.n_estimators += _WARM_START_TREES
+
+        return model, False
     
-    async def _retrain_ownership_model(self, training_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _retrain_ownership_model(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Retrain ownership model"""
-        
-        df = pd.DataFrame(training_data)
-        
+
         feature_columns = [
             'salary', 'projected_points', 'public_projection_rank',
             'media_sentiment', 'vegas_total', 'injury_concern'
@@ -151,18 +267,39 @@ class ModelTrainer:
         if len(available_features) < 3:
             raise ValueError("Insufficient features for training")
         
-        X = df[available_features].fillna(0)
-        y = df['actual_ownership'].fillna(10.0)
-        
+        X = np.ascontiguousarray(
+            df[available_features].to_numpy(dtype=np.float32, na_value=0.0)
+        )
+        y = df['actual_ownership'].to_numpy(dtype=np.float32, na_value=10.0)
+
         from xgboost import XGBRegressor
+        from xgboost.core import XGBoostError
         from sklearn.model_selection import train_test_split
         from sklearn.metrics import mean_absolute_error
-        
+
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        
-        model = XGBRegressor(n_estimators=100, random_state=42)
-        model.fit(X_train, y_train)
-        
+
+        model = XGBRegressor(
+            n_estimators=100, random_state=42,
+            tree_method='hist', device=_ML_DEVICE
+        )
+
+        fit_X, fit_y = X_train, y_train
+        if _ML_DEVICE == 'cuda':
+            import cupy
+            fit_X = cupy.asarray(X_train)
+            fit_y = cupy.asarray(y_train)
+
+        try:
+            model.fit(fit_X, fit_y)
+        except XGBoostError as e:
+            logger.warning("GPU training unavailable, retrying on CPU", error=str(e))
+            model = XGBRegressor(
+                n_estimators=100, random_state=42,
+                tree_method='hist', device='cpu'
+            )
+            model.fit(X_train, y_train)
+
         y_pred = model.predict(X_test)
         mae = mean_absolute_error(y_test, y_pred)
         
@@ -177,35 +314,39 @@ class ModelTrainer:
             }
         }
     
-    async def _get_training_data(self, model_name: str) -> List[Dict[str, Any]]:
-        """Get training data for model"""
-        
-        sample_data = []
-        
-        for i in range(100):
-            sample_data.append({
-                'player_id': f'player_{i}',
-                'passing_yards_avg': 250 + (i % 50),
-                'passing_tds_avg': 1.5 + (i % 3) * 0.5,
-                'rushing_yards_avg': 50 + (i % 30),
-                'receiving_yards_avg': 60 + (i % 40),
-                'targets_avg': 6 + (i % 8),
-                'snap_percentage': 0.7 + (i % 3) * 0.1,
-                'opponent_rank': 1 + (i % 32),
-                'vegas_total': 42 + (i % 16),
-                'weather_score': 0.8 + (i % 2) * 0.2,
-                'salary': 5000 + (i % 50) * 100,
-                'projected_points': 10 + (i % 20),
-                'public_projection_rank': 1 + (i % 100),
-                'media_sentiment': -0.5 + (i % 10) * 0.1,
-                'injury_concern': (i % 5) * 0.2,
-                'actual_points': 8 + (i % 25),
-                'actual_ownership': 5 + (i % 30)
-            })
-        
-        return sample_data
+    async def _get_training_data(self, model_name: str) -> pd.DataFrame:
+        """Get training data for model as a column-oriented DataFrame"""
+
+        n = 100
+        i = np.arange(n)
+
+        # Assemble through an Arrow table so the numeric columns reach the
+        # DataFrame zero-copy instead of being materialized twice.
+        table = pa.table({
+            'player_id': [f'player_{j}' for j in range(n)],
+            'passing_yards_avg': 250 + (i % 50),
+            'passing_tds_avg': 1.5 + (i % 3) * 0.5,
+            'rushing_yards_avg': 50 + (i % 30),
+            'receiving_yards_avg': 60 + (i % 40),
+            'targets_avg': 6 + (i % 8),
+            'snap_percentage': 0.7 + (i % 3) * 0.1,
+            'opponent_rank': 1 + (i % 32),
+            'vegas_total': 42 + (i % 16),
+            'weather_score': 0.8 + (i % 2) * 0.2,
+            'salary': 5000 + (i % 50) * 100,
+            'projected_points': 10 + (i % 20),
+            'public_projection_rank': 1 + (i % 100),
+            'media_sentiment': -0.5 + (i % 10) * 0.1,
+            'injury_concern': (i % 5) * 0.2,
+            'actual_points': 8 + (i % 25),
+            'actual_ownership': 5 + (i % 30)
+        })
+
+        return table.to_pandas(split_blocks=True, self_destruct=True)
     
-    async def _version_model(self, model_name: str, training_result: Dict[str, Any]) -> str:
+    async def _version_model(
+        self, model_name: str, training_result: Dict[str, Any], now_iso: str
+    ) -> str:
         """Create new version for trained model"""
         
         current_version = self.model_versions.get(model_name, 0)
@@ -215,30 +356,75 @@ class ModelTrainer:
         
         self.model_versions[model_name] = new_version
         
+        model = training_result.get('model')
+
         model_info = {
             'version': version_string,
-            'trained_at': datetime.now(timezone.utc).isoformat(),
+            'trained_at': now_iso,
             'metrics': training_result.get('metrics', {}),
-            'features': training_result.get('features', [])
+            'features': training_result.get('features', []),
+            'inference_lib': self._compile_inference_lib(model, version_string)
         }
         
         cache_key = f"model_version:{version_string}"
-        redis_client.setex(cache_key, 86400 * 30, str(model_info))
+
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(cache_key, 86400 * 30, serialize_for_cache(model_info))
+            if model is not None:
+                # Protocol 5 serializes the estimator's ndarrays out-of-band;
+                # inference workers load the blob once with pickle.loads
+                pipe.setex(
+                    f"model_blob:{version_string}",
+                    86400 * 30,
+                    pickle.dumps(model, protocol=5)
+                )
+            await pipe.execute()
         
         logger.info("Model versioned", version=version_string)
         
         return version_string
     
-    async def _update_model_registry(self, training_summary: Dict[str, Any]):
+    def _compile_inference_lib(self, model, version_string: str) -> Optional[str]:
+        """
+        Compile a fitted forest to a treelite shared library so prediction
+        services can serve it via FIL / treelite_runtime. Returns the lib
+        path, or None when treelite is absent or the model is unsupported.
+        """
+
+        if model is None:
+            return None
+
+        try:
+            import treelite
+            import treelite.sklearn
+        except ImportError:
+            return None
+
+        try:
+            import os
+            os.makedirs(settings.model_lib_dir, exist_ok=True)
+            lib_path = os.path.join(settings.model_lib_dir, f"{version_string}.so")
+
+            tl_model = treelite.sklearn.import_model(model)
+            tl_model.export_lib(toolchain='gcc', libpath=lib_path, verbose=False)
+
+            logger.info("Compiled inference library", lib_path=lib_path)
+            return lib_path
+
+        except Exception as e:
+            logger.warning("Could not compile inference library", error=str(e))
+            return None
+
+    async def _update_model_registry(self, training_summary: Dict[str, Any], now_iso: str):
         """Update model registry with training results"""
         
         registry_key = "model_registry"
         registry_data = {
             'last_training': training_summary,
-            'updated_at': datetime.now(timezone.utc).isoformat()
+            'updated_at': now_iso
         }
         
-        redis_client.setex(registry_key, 86400 * 7, str(registry_data))
+        await async_redis_client.setex(registry_key, 86400 * 7, serialize_for_cache(registry_data))
         
         logger.info("Model registry updated")
     
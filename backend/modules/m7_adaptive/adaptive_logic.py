@@ -1,13 +1,66 @@
 import asyncio
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 import structlog
 
-from shared.utils import get_current_nfl_week, is_low_data_mode
-from shared.database import get_db, redis_client
+from shared.utils import get_current_nfl_week, is_low_data_mode, serialize_for_cache
+from shared.database import get_db, redis_client, async_redis_client
 
 logger = structlog.get_logger()
 
+_LOW_DATA_ADJUSTMENTS = {
+    'feature_weights': {
+        'previous_season_data': 1.5,
+        'vegas_market_data': 1.3,
+        'draft_position': 1.2,
+        'preseason_performance': 1.1,
+        'in_season_data': 0.3
+    },
+    'model_adjustments': {
+        'projection_confidence': 0.8,
+        'ownership_confidence': 0.7,
+        'simulation_variance': 1.2
+    },
+    'data_sources': {
+        'prioritize_vegas': True,
+        'use_expert_consensus': True,
+        'reduce_news_weight': True,
+        'increase_historical_weight': True
+    }
+}
+
+_FULL_DATA_ADJUSTMENTS = {
+    'feature_weights': {
+        'recent_performance': 1.5,
+        'in_season_trends': 1.3,
+        'matchup_data': 1.2,
+        'injury_reports': 1.1,
+        'previous_season_data': 0.8
+    },
+    'model_adjustments': {
+        'projection_confidence': 1.0,
+        'ownership_confidence': 1.0,
+        'simulation_variance': 1.0
+    },
+    'data_sources': {
+        'prioritize_recent': True,
+        'use_full_news_sentiment': True,
+        'include_advanced_metrics': True,
+        'weight_current_season': True
+    }
+}
+
+
+def _copy_adjustments(adjustments: Dict[str, Any]) -> Dict[str, Any]:
+    """Two-level shallow copy of an adjustment table.
+
+    The tables are exactly two dicts deep with scalar leaves, so this
+    gives callers the same mutation isolation as deepcopy at a fraction
+    of the cost.
+    """
+    return {section: dict(values) for section, values in adjustments.items()}
+
 
 class AdaptiveLogic:
     """
@@ -24,6 +77,8 @@ class AdaptiveLogic:
         
         logger.info("Determining operational mode", week=week, season=season)
         
+        now_iso = datetime.now(timezone.utc).isoformat()
+
         try:
             current_week = get_current_nfl_week()
             low_data_mode = is_low_data_mode()
@@ -31,11 +86,11 @@ class AdaptiveLogic:
             if low_data_mode:
                 mode = 'low_data'
                 confidence_multiplier = 0.8
-                feature_adjustments = await self._get_low_data_adjustments()
+                feature_adjustments = self._get_low_data_adjustments()
             else:
                 mode = 'full_data'
                 confidence_multiplier = 1.0
-                feature_adjustments = await self._get_full_data_adjustments()
+                feature_adjustments = self._get_full_data_adjustments()
             
             mode_info = {
                 'operational_mode': mode,
@@ -45,11 +100,11 @@ class AdaptiveLogic:
                 'confidence_multiplier': confidence_multiplier,
                 'feature_adjustments': feature_adjustments,
                 'transition_week': 5,
-                'determined_at': datetime.now(timezone.utc).isoformat()
+                'determined_at': now_iso
             }
             
             if self.current_mode != mode:
-                await self._handle_mode_transition(self.current_mode, mode)
+                await self._handle_mode_transition(self.current_mode, mode, now_iso)
                 self.current_mode = mode
             
             self.mode_history.append(mode_info)
@@ -66,55 +121,17 @@ class AdaptiveLogic:
             logger.error("Error determining operational mode", error=str(e))
             raise
     
-    async def _get_low_data_adjustments(self) -> Dict[str, Any]:
+    def _get_low_data_adjustments(self) -> Dict[str, Any]:
         """Get feature adjustments for low-data mode"""
-        
-        return {
-            'feature_weights': {
-                'previous_season_data': 1.5,
-                'vegas_market_data': 1.3,
-                'draft_position': 1.2,
-                'preseason_performance': 1.1,
-                'in_season_data': 0.3
-            },
-            'model_adjustments': {
-                'projection_confidence': 0.8,
-                'ownership_confidence': 0.7,
-                'simulation_variance': 1.2
-            },
-            'data_sources': {
-                'prioritize_vegas': True,
-                'use_expert_consensus': True,
-                'reduce_news_weight': True,
-                'increase_historical_weight': True
-            }
-        }
-    
-    async def _get_full_data_adjustments(self) -> Dict[str, Any]:
+
+        return _copy_adjustments(_LOW_DATA_ADJUSTMENTS)
+
+    def _get_full_data_adjustments(self) -> Dict[str, Any]:
         """Get feature adjustments for full-data mode"""
-        
-        return {
-            'feature_weights': {
-                'recent_performance': 1.5,
-                'in_season_trends': 1.3,
-                'matchup_data': 1.2,
-                'injury_reports': 1.1,
-                'previous_season_data': 0.8
-            },
-            'model_adjustments': {
-                'projection_confidence': 1.0,
-                'ownership_confidence': 1.0,
-                'simulation_variance': 1.0
-            },
-            'data_sources': {
-                'prioritize_recent': True,
-                'use_full_news_sentiment': True,
-                'include_advanced_metrics': True,
-                'weight_current_season': True
-            }
-        }
+
+        return _copy_adjustments(_FULL_DATA_ADJUSTMENTS)
     
-    async def _handle_mode_transition(self, old_mode: Optional[str], new_mode: str):
+    async def _handle_mode_transition(self, old_mode: Optional[str], new_mode: str, now_iso: str):
         """Handle transition between operational modes"""
         
         if old_mode is None:
@@ -126,7 +143,7 @@ class AdaptiveLogic:
         transition_info = {
             'from_mode': old_mode,
             'to_mode': new_mode,
-            'transition_time': datetime.now(timezone.utc).isoformat(),
+            'transition_time': now_iso,
             'actions_taken': []
         }
         
@@ -225,18 +242,21 @@ class AdaptiveLogic:
     async def _store_mode_info(self, mode_info: Dict[str, Any]):
         """Store mode information in cache"""
         
-        cache_key = f"adaptive_mode:week_{mode_info['week']}_{mode_info['season']}"
-        redis_client.setex(cache_key, 86400, str(mode_info))
-        
-        current_mode_key = "adaptive_mode:current"
-        redis_client.setex(current_mode_key, 3600, str(mode_info))
+        # bytes keys skip redis-py's str->bytes encode on every call
+        cache_key = b"adaptive_mode:week_%d_%d" % (mode_info['week'], mode_info['season'])
+        payload = serialize_for_cache(mode_info)
+
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(cache_key, 86400, payload)
+            pipe.setex(b"adaptive_mode:current", 3600, payload)
+            await pipe.execute()
         
         logger.info("Mode info stored", cache_key=cache_key)
     
     async def _store_transition_info(self, transition_info: Dict[str, Any]):
         """Store mode transition information"""
         
-        cache_key = f"mode_transition:{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        redis_client.setex(cache_key, 86400 * 7, str(transition_info))
+        cache_key = f"mode_transition:{time.time_ns():x}"
+        await async_redis_client.setex(cache_key, 86400 * 7, serialize_for_cache(transition_info))
         
         logger.info("Transition info stored", cache_key=cache_key)
@@ -1,4 +1,6 @@
 import asyncio
+import numpy as np
+import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 import structlog
@@ -7,6 +9,43 @@ from shared.database import get_db, redis_client
 
 logger = structlog.get_logger()
 
+# Per-position tables laid out SoA: one position->code LUT, one array per
+# attribute. Unlisted positions use the FLEX row (WR salary baseline).
+_POS_CODES = {'QB': 0, 'RB': 1, 'WR': 2, 'TE': 3, 'DST': 4, 'FLEX': 5}
+_DEFAULT_POS_CODE = _POS_CODES['FLEX']
+_POS_CONFIDENCE_ARR = np.array([0.85, 0.75, 0.70, 0.65, 0.80, 0.75], dtype=np.float32)
+_POS_VARIANCE_ARR = np.array([1.1, 1.2, 1.3, 1.4, 1.15, 1.2], dtype=np.float32)
+_MIN_SALARY_ARR = np.array([4500.0, 4000.0, 3500.0, 3000.0, 2000.0, 3500.0])
+_MAX_SALARY_ARR = np.array([9000.0, 10000.0, 9500.0, 7500.0, 5000.0, 9500.0])
+_BASE_OWNERSHIP_ARR = np.array([12.0, 8.0, 6.0, 5.0, 10.0, 6.0])
+_POS_OWN_MULT_ARR = np.array([1.1, 1.0, 1.0, 1.0, 0.9, 1.0])
+
+_POPULAR_TEAMS = frozenset({'KC', 'BUF', 'SF', 'PHI'})
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _base_ownership_kernel(salary, pos_idx, min_salary, max_salary, baseline):
+    out = np.empty(salary.shape[0])
+    for i in range(salary.shape[0]):
+        low = min_salary[pos_idx[i]]
+        high = max_salary[pos_idx[i]]
+        base = baseline[pos_idx[i]]
+        ratio = (salary[i] - low) / (high - low)
+        if ratio < 0.0:
+            ratio = 0.0
+        elif ratio > 1.0:
+            ratio = 1.0
+        out[i] = base + ratio * (base * 2.0)
+    return out
+
+
+if njit is not None:
+    _base_ownership_kernel = njit(cache=True)(_base_ownership_kernel)
+
 
 class LowDataHandler:
     """
@@ -28,66 +67,77 @@ class LowDataHandler:
                    projections=len(base_projections))
         
         try:
-            processed_projections = []
-            
-            for projection in base_projections:
-                processed = await self._apply_low_data_adjustments(projection)
-                processed_projections.append(processed)
-            
-            logger.info("Low-data projections processed", 
+            if not base_projections:
+                return []
+
+            df = pd.DataFrame(base_projections)
+
+            if 'position' in df.columns:
+                positions = df['position'].fillna('FLEX')
+            else:
+                positions = pd.Series('FLEX', index=df.index)
+
+            pos_idx = positions.map(_POS_CODES).fillna(_DEFAULT_POS_CODE).to_numpy(dtype=np.int64)
+            confidence = _POS_CONFIDENCE_ARR[pos_idx]
+            variance = _POS_VARIANCE_ARR[pos_idx]
+
+            if 'projected_points' in df.columns:
+                base_points = df['projected_points'].fillna(10).to_numpy()
+            else:
+                base_points = np.full(len(df), 10.0)
+
+            if 'confidence_score' in df.columns:
+                base_confidence = df['confidence_score'].fillna(1.0).to_numpy()
+            else:
+                base_confidence = np.ones(len(df))
+
+            df['confidence_score'] = base_confidence * confidence
+            df['ceiling_points'] = base_points * 1.3 * variance
+            df['floor_points'] = base_points * 0.6 / variance
+
+            fallback_by_position = {
+                position: self._get_fallback_data_sources(position)
+                for position in positions.unique()
+            }
+
+            df['low_data_adjustments'] = [
+                {
+                    'confidence_reduction': 1 - conf,
+                    'variance_increase': var - 1,
+                    'fallback_data_used': fallback_by_position[position]
+                }
+                for conf, var, position in zip(confidence, variance, positions)
+            ]
+
+            # DataFrame construction unions every record's keys and fills
+            # the gaps with float NaN; drop those again so each record
+            # keeps its original key set and downstream .get defaults
+            # still fire for absent fields
+            processed_projections = [
+                {k: v for k, v in record.items()
+                 if not (isinstance(v, float) and np.isnan(v))}
+                for record in df.to_dict(orient='records')
+            ]
+
+            logger.info("Low-data projections processed",
                        processed=len(processed_projections))
-            
+
             return processed_projections
-            
+
         except Exception as e:
             logger.error("Error processing low-data projections", error=str(e))
             raise
-    
-    async def _apply_low_data_adjustments(self, projection: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply low-data specific adjustments to projection"""
-        
-        adjusted = projection.copy()
-        
-        position = projection.get('position', 'FLEX')
-        
-        position_adjustments = {
-            'QB': {'confidence': 0.85, 'variance': 1.1},
-            'RB': {'confidence': 0.75, 'variance': 1.2},
-            'WR': {'confidence': 0.70, 'variance': 1.3},
-            'TE': {'confidence': 0.65, 'variance': 1.4},
-            'DST': {'confidence': 0.80, 'variance': 1.15}
-        }
-        
-        pos_adj = position_adjustments.get(position, {'confidence': 0.75, 'variance': 1.2})
-        
-        adjusted['confidence_score'] = projection.get('confidence_score', 1.0) * pos_adj['confidence']
-        
-        base_points = projection.get('projected_points', 10)
-        variance_multiplier = pos_adj['variance']
-        
-        adjusted['ceiling_points'] = base_points * 1.3 * variance_multiplier
-        adjusted['floor_points'] = base_points * 0.6 / variance_multiplier
-        
-        adjusted['low_data_adjustments'] = {
-            'confidence_reduction': 1 - pos_adj['confidence'],
-            'variance_increase': variance_multiplier - 1,
-            'fallback_data_used': await self._get_fallback_data_sources(projection)
-        }
-        
-        return adjusted
-    
-    async def _get_fallback_data_sources(self, projection: Dict[str, Any]) -> List[str]:
-        """Get fallback data sources used for projection"""
-        
+
+    def _get_fallback_data_sources(self, position: str) -> List[str]:
+        """Get fallback data sources used for a position's projections"""
+
         fallback_sources = [
             'previous_season_stats',
             'draft_position',
             'vegas_implied_totals',
             'expert_consensus_rankings'
         ]
-        
-        position = projection.get('position', 'FLEX')
-        
+
         if position == 'QB':
             fallback_sources.extend(['preseason_passing_yards', 'team_offensive_line_rank'])
         elif position in ['RB', 'WR', 'TE']:
@@ -107,100 +157,87 @@ class LowDataHandler:
                    players=len(player_data))
         
         try:
-            predictions = []
-            
-            for player in player_data:
-                prediction = await self._predict_low_data_ownership(player)
-                predictions.append(prediction)
-            
-            logger.info("Low-data ownership predictions generated", 
+            if not player_data:
+                return []
+
+            df = pd.DataFrame(player_data)
+
+            if 'position' in df.columns:
+                positions = df['position'].fillna('FLEX')
+            else:
+                positions = pd.Series('FLEX', index=df.index)
+
+            if 'salary' in df.columns:
+                salary = df['salary'].fillna(5000).to_numpy(dtype=float)
+            else:
+                salary = np.full(len(df), 5000.0)
+
+            pos_idx = positions.map(_POS_CODES).fillna(_DEFAULT_POS_CODE).to_numpy(dtype=np.int64)
+            base_ownership = self._calculate_base_ownership(salary, pos_idx)
+
+            if 'team' in df.columns:
+                popular_team = df['team'].fillna('').isin(_POPULAR_TEAMS).to_numpy()
+            else:
+                popular_team = np.zeros(len(df), dtype=bool)
+
+            is_qb = pos_idx == _POS_CODES['QB']
+            is_dst = pos_idx == _POS_CODES['DST']
+
+            if 'draft_position' in df.columns:
+                draft_position = df['draft_position'].fillna(150).to_numpy(dtype=float)
+            else:
+                draft_position = np.full(len(df), 150.0)
+
+            high_draft = draft_position <= 50
+            low_draft = draft_position >= 200
+
+            multiplier = np.where(popular_team, 1.2, 1.0)
+            multiplier = multiplier * np.take(_POS_OWN_MULT_ARR, pos_idx)
+            multiplier = multiplier * np.where(high_draft, 1.3, np.where(low_draft, 0.8, 1.0))
+
+            adjusted_ownership = np.clip(base_ownership * multiplier, 0.5, 50.0)
+
+            predictions = [
+                {
+                    'player_id': player.get('player_id'),
+                    'name': player.get('name'),
+                    'position': position,
+                    'salary': player.get('salary', 5000),
+                    'projected_ownership': round(float(ownership), 2),
+                    'confidence_score': 0.7,
+                    'low_data_mode': True,
+                    'base_ownership': round(float(base), 2),
+                    'adjustments_applied': [
+                        factor for factor, flag in (
+                            ('popular_team_boost', popular),
+                            ('qb_popularity_boost', qb),
+                            ('dst_lower_variance', dst),
+                            ('high_draft_capital', high),
+                            ('low_draft_capital', low)
+                        ) if flag
+                    ]
+                }
+                for player, position, ownership, base, popular, qb, dst, high, low in zip(
+                    player_data, positions, adjusted_ownership, base_ownership,
+                    popular_team, is_qb, is_dst, high_draft, low_draft
+                )
+            ]
+
+            logger.info("Low-data ownership predictions generated",
                        predictions=len(predictions))
-            
+
             return predictions
-            
+
         except Exception as e:
             logger.error("Error generating low-data ownership predictions", error=str(e))
             raise
-    
-    async def _predict_low_data_ownership(self, player: Dict[str, Any]) -> Dict[str, Any]:
-        """Predict ownership for individual player in low-data mode"""
-        
-        salary = player.get('salary', 5000)
-        position = player.get('position', 'FLEX')
-        
-        base_ownership = self._calculate_base_ownership(salary, position)
-        
-        adjustments = await self._get_low_data_ownership_adjustments(player)
-        
-        adjusted_ownership = base_ownership * adjustments['multiplier']
-        adjusted_ownership = max(0.5, min(50.0, adjusted_ownership))
-        
-        return {
-            'player_id': player.get('player_id'),
-            'name': player.get('name'),
-            'position': position,
-            'salary': salary,
-            'projected_ownership': round(adjusted_ownership, 2),
-            'confidence_score': adjustments['confidence'],
-            'low_data_mode': True,
-            'base_ownership': round(base_ownership, 2),
-            'adjustments_applied': adjustments['factors']
-        }
-    
-    def _calculate_base_ownership(self, salary: int, position: str) -> float:
-        """Calculate base ownership based on salary and position"""
-        
-        position_baselines = {
-            'QB': {'min_salary': 4500, 'max_salary': 9000, 'base_ownership': 12},
-            'RB': {'min_salary': 4000, 'max_salary': 10000, 'base_ownership': 8},
-            'WR': {'min_salary': 3500, 'max_salary': 9500, 'base_ownership': 6},
-            'TE': {'min_salary': 3000, 'max_salary': 7500, 'base_ownership': 5},
-            'DST': {'min_salary': 2000, 'max_salary': 5000, 'base_ownership': 10}
-        }
-        
-        baseline = position_baselines.get(position, position_baselines['WR'])
-        
-        salary_ratio = (salary - baseline['min_salary']) / (baseline['max_salary'] - baseline['min_salary'])
-        salary_ratio = max(0, min(1, salary_ratio))
-        
-        ownership_range = baseline['base_ownership'] * 2
-        base_ownership = baseline['base_ownership'] + (salary_ratio * ownership_range)
-        
-        return base_ownership
-    
-    async def _get_low_data_ownership_adjustments(self, player: Dict[str, Any]) -> Dict[str, Any]:
-        """Get ownership adjustments for low-data mode"""
-        
-        multiplier = 1.0
-        confidence = 0.7
-        factors = []
-        
-        team = player.get('team', '')
-        if team in ['KC', 'BUF', 'SF', 'PHI']:
-            multiplier *= 1.2
-            factors.append('popular_team_boost')
-        
-        position = player.get('position', 'FLEX')
-        if position == 'QB':
-            multiplier *= 1.1
-            factors.append('qb_popularity_boost')
-        elif position == 'DST':
-            multiplier *= 0.9
-            factors.append('dst_lower_variance')
-        
-        draft_position = player.get('draft_position', 150)
-        if draft_position <= 50:
-            multiplier *= 1.3
-            factors.append('high_draft_capital')
-        elif draft_position >= 200:
-            multiplier *= 0.8
-            factors.append('low_draft_capital')
-        
-        return {
-            'multiplier': multiplier,
-            'confidence': confidence,
-            'factors': factors
-        }
+
+    def _calculate_base_ownership(self, salary: np.ndarray, pos_idx: np.ndarray) -> np.ndarray:
+        """Calculate base ownership for the batch from salary and position codes"""
+
+        return _base_ownership_kernel(
+            salary, pos_idx, _MIN_SALARY_ARR, _MAX_SALARY_ARR, _BASE_OWNERSHIP_ARR
+        )
     
     async def get_low_data_recommendations(self) -> Dict[str, Any]:
         """Get recommendations for low-data mode operation"""
@@ -1,5 +1,6 @@
 ﻿# ATHENA v2.2 - Vector Database Module
 # Clean imports to avoid encoding issues
+import asyncio
 
 try:
     from .vector_database import VectorDatabaseManager, VECTOR_DEPS_AVAILABLE as VDB_AVAILABLE
@@ -65,15 +66,22 @@ class VectorIntegrationService:
             # Format results to match expected structure
             results = []
             for result in podcast_results:
+                metadata = result.get('metadata', {})
                 results.append({
                     'content': result.get('content', ''),
                     'source': 'podcast',
-                    'team': result.get('metadata', {}).get('team_name', ''),
+                    'content_type': 'podcast_transcript',
+                    'team': metadata.get('team_name', ''),
+                    'publish_date': metadata.get('publish_date', ''),
                     'relevance_score': result.get('similarity_score', 0),
-                    'age_days': 0,  # TODO: Calculate age from timestamp
                     'sentiment': 'neutral'
                 })
 
+            # Temporal scoring/ranking is CPU-bound; keep it off the event loop
+            results = await asyncio.to_thread(
+                self.temporal_processor.score_rank_and_filter, results, 30
+            )
+
             return {
                 'query': query,
                 'total_results': len(results),
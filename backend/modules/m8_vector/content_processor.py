@@ -1,6 +1,10 @@
 # Content Processor for ATHENA v2.2
+import os
 import re
 import json
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from functools import cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 import structlog
@@ -12,10 +16,198 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     SentenceTransformer = None
 
+try:
+    import torch
+    torch.set_num_threads(os.cpu_count() or 1)
+except ImportError:
+    pass
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 from shared.config import settings
 
 logger = structlog.get_logger()
 
+# Keyword tables and compiled scanners are shared by every processor
+# instance (workers, reloads); nothing below changes at runtime.
+FANTASY_KEYWORDS = {
+    'performance': (
+        'playing', 'performing', 'production', 'output', 'touchdowns',
+        'yards', 'carries', 'targets', 'receptions', 'fantasy points'
+    ),
+    'health': (
+        'injury', 'healthy', 'recovery', 'practice', 'IR', 'questionable',
+        'doubtful', 'probable', 'out', 'return', 'concussion', 'hamstring'
+    ),
+    'situational': (
+        'matchup', 'defense', 'opponent', 'weather', 'home', 'away',
+        'travel', 'rest', 'bye week', 'schedule'
+    ),
+    'team_dynamics': (
+        'chemistry', 'coaching', 'scheme', 'playbook', 'confidence',
+        'leadership', 'rookie', 'veteran', 'depth', 'competition'
+    )
+}
+
+CATEGORY_WEIGHTS = {
+    'performance': 0.4,
+    'health': 0.5,
+    'situational': 0.3,
+    'team_dynamics': 0.2
+}
+
+DFS_PATTERNS = (
+    r'(?:should|could|might|will) (?:be|have|get|see|play) (?:\w+ ){0,5}(?:points|fantasy|production)',
+    r'(?:high|low|big|good|bad) (?:week|game|matchup|performance) (?:for|against)',
+    r'(?:over|under) (?:performing|producing|expected)',
+    r'(?:favorite|sleepers?|chalk|value) (?:play|player|pick)',
+    r'(?:ownership|correlation|stack|leverage) (?:percentage|rate|score)'
+)
+
+POSITIVE_WORDS = (
+    'great', 'excellent', 'outstanding', 'fantastic', 'amazing',
+    'impressive', 'strong', 'dominant', 'explosive', 'elite'
+)
+NEGATIVE_WORDS = (
+    'worried', 'concerned', 'struggling', 'poor', 'weak',
+    'disappointing', 'injured', 'questionable', 'doubtful'
+)
+
+# Membership sets: tokenize once, then O(1) hash lookups instead of one
+# substring scan per keyword. Multi-word phrases cannot be token-matched
+# and stay on a small substring tuple.
+_TOK_RE = re.compile(r"[a-z0-9']+")
+_TEAM_SET = frozenset([
+    'chiefs', 'chargers', 'raiders', 'broncos',
+    'patriots', 'jets', 'bills', 'dolphins',
+    'packers', 'vikings', 'bears', 'lions',
+    'cowboys', 'eagles', 'giants', 'commanders',
+    'buccaneers', 'falcons', 'panthers', 'saints',
+    'steelers', 'ravens', 'bengals', 'browns',
+    'titans', 'colts', 'jaguars', 'texans',
+    'seahawks', 'rams', 'cardinals', '49ers'
+])
+_POSITIVE_SET = frozenset(POSITIVE_WORDS)
+_NEGATIVE_SET = frozenset(NEGATIVE_WORDS)
+_POSITIVE_NEWS_SET = frozenset(
+    ['upgrade', 'healthy', 'returning', 'expected', 'confident']
+)
+_NEGATIVE_NEWS_SET = frozenset(
+    ['downgrade', 'injury', 'concerned', 'doubtful', 'questionable']
+)
+_PLAYER_INDICATOR_SET = frozenset([
+    'quarterback', 'qb', 'rb', 'wr', 'te', 'ol', 'dl', 'lb', 'db',
+    'safety', 'cornerback', 'linebacker'
+])
+_PLAYER_INDICATOR_PHRASES = (
+    'running back', 'wide receiver', 'tight end',
+    'offensive line', 'defensive line', 'defensive back'
+)
+_FANTASY_TERM_SET = frozenset(
+    ['fantasy', 'dfs', 'ownership', 'projection', 'points']
+)
+_HEALTH_TERM_SET = frozenset(['injury', 'healthy', 'practice', 'ir'])
+
+
+@cache
+def _dfs_regex() -> re.Pattern:
+    """One union alternation scans each sentence in a single pass"""
+    return re.compile('(?:' + ')|(?:'.join(DFS_PATTERNS) + ')', re.IGNORECASE)
+
+
+@cache
+def _sentence_splitter_regex() -> re.Pattern:
+    return re.compile(r'[.!?]+')
+
+
+@cache
+def _keyword_scanner():
+    """
+    Build the sparse keyword scorer once per process: a binary
+    CountVectorizer over all fantasy keywords, a parallel per-keyword
+    weight vector, and the vocabulary slice for each category.
+    """
+    vocab = []
+    weights = []
+    category_slices = {}
+    for category, keywords in FANTASY_KEYWORDS.items():
+        start = len(vocab)
+        vocab.extend(keyword.lower() for keyword in keywords)
+        weights.extend([CATEGORY_WEIGHTS[category]] * len(keywords))
+        category_slices[category] = slice(start, len(vocab))
+
+    vectorizer = CountVectorizer(vocabulary=vocab, ngram_range=(1, 2), binary=True)
+    return vectorizer, np.array(weights), category_slices
+
+
+@cache
+def _sentiment_scanner():
+    vectorizer = CountVectorizer(
+        vocabulary=POSITIVE_WORDS + NEGATIVE_WORDS, binary=True
+    )
+    return vectorizer, len(POSITIVE_WORDS)
+
+
+@cache
+def _keyword_id_tables():
+    """
+    Flat token-id tables for the JIT scoring kernel: unigram keyword ->
+    id, adjacent-bigram keyword pair -> id, and the weight per id. Id
+    order matches the CountVectorizer vocabulary.
+    """
+    unigrams = {}
+    bigrams = {}
+    weights = []
+    idx = 0
+    for category, keywords in FANTASY_KEYWORDS.items():
+        for keyword in keywords:
+            parts = keyword.lower().split()
+            if len(parts) == 1:
+                unigrams[parts[0]] = idx
+            else:
+                bigrams[(parts[0], parts[1])] = idx
+            weights.append(CATEGORY_WEIGHTS[category])
+            idx += 1
+
+    return unigrams, bigrams, np.array(weights)
+
+
+def _keyword_score_kernel(tok_ids, offsets, weights, n_vocab):
+    n_sent = offsets.shape[0] - 1
+    out = np.zeros(n_sent)
+    seen = np.zeros((n_sent, n_vocab), dtype=np.bool_)
+    for s in prange(n_sent):
+        acc = 0.0
+        for j in range(offsets[s], offsets[s + 1]):
+            tid = tok_ids[j]
+            if tid >= 0 and not seen[s, tid]:
+                seen[s, tid] = True
+                acc += weights[tid]
+        out[s] = acc
+    return out
+
+
+if njit is not None:
+    _keyword_score_kernel = njit(parallel=True, cache=True)(_keyword_score_kernel)
+
+# The JIT path only pays off once the per-call warmup amortizes
+_JIT_SENTENCE_THRESHOLD = 200
+
+# Lowercase ASCII and strip punctuation to spaces in one translate pass
+# instead of separate .lower()/.strip() allocations per helper
+_LOWER_TABLE = str.maketrans(
+    {chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)}
+    | {c: ' ' for c in ',.;:!?()[]"'}
+)
+
+# Two insights closer than this in embedding space are the same take
+# phrased twice
+_INSIGHT_DEDUPE_THRESHOLD = 0.9
+
 
 class ContentVectorProcessor:
     """
@@ -27,36 +219,62 @@ class ContentVectorProcessor:
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError("Sentence transformers not available")
 
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-
-        # Fantasy-relevant keywords and patterns
-        self.fantasy_keywords = {
-            'performance': [
-                'playing', 'performing', 'production', 'output', 'touchdowns',
-                'yards', 'carries', 'targets', 'receptions', 'fantasy points'
-            ],
-            'health': [
-                'injury', 'healthy', 'recovery', 'practice', 'IR', 'questionable',
-                'doubtful', 'probable', 'out', 'return', 'concussion', 'hamstring'
-            ],
-            'situational': [
-                'matchup', 'defense', 'opponent', 'weather', 'home', 'away',
-                'travel', 'rest', 'bye week', 'schedule'
-            ],
-            'team_dynamics': [
-                'chemistry', 'coaching', 'scheme', 'playbook', 'confidence',
-                'leadership', 'rookie', 'veteran', 'depth', 'competition'
-            ]
-        }
+        self.embedding_model = self._load_embedding_model()
+
+        # Shared, immutable scanners (module-level singletons)
+        self.fantasy_keywords = FANTASY_KEYWORDS
+        self.dfs_patterns = DFS_PATTERNS
+        self.category_weights = CATEGORY_WEIGHTS
+        self.positive_words = POSITIVE_WORDS
+        self.negative_words = NEGATIVE_WORDS
+        self._dfs_re = _dfs_regex()
+        self._sentence_splitter = _sentence_splitter_regex()
+        self._kw_vectorizer, self._kw_weights, self._kw_category_slices = _keyword_scanner()
+        self._sentiment_vectorizer, self._n_positive = _sentiment_scanner()
+        self._tok_re = _TOK_RE
+        self._team_set = _TEAM_SET
+        self._positive_set = _POSITIVE_SET
+        self._negative_set = _NEGATIVE_SET
+        self._positive_news_set = _POSITIVE_NEWS_SET
+        self._negative_news_set = _NEGATIVE_NEWS_SET
+        self._player_indicator_set = _PLAYER_INDICATOR_SET
+        self._player_indicator_phrases = _PLAYER_INDICATOR_PHRASES
+        self._fantasy_term_set = _FANTASY_TERM_SET
+        self._health_term_set = _HEALTH_TERM_SET
+
+        # Embedding cache: repeated quotes/boilerplate across episodes
+        # reuse their vectors instead of re-encoding
+        self._emb_cache: Dict[str, Any] = {}
+        self._emb_cache_limit = 16384
+
+    def _load_embedding_model(self):
+        """
+        Load MiniLM for embedding, preferring a dynamically quantized INT8
+        ONNX export on CPU (roughly 2-4x FP32 throughput). Falls back to
+        the FP32 PyTorch model when ONNX runtime support is unavailable
+        or settings.embedding_precision is 'fp32'.
+        """
+        if settings.embedding_precision == 'fp32':
+            return SentenceTransformer('all-MiniLM-L6-v2')
+
+        quantized_dir = os.path.join(settings.vector_db_path, 'onnx-int8')
 
-        # DFS-specific patterns
-        self.dfs_patterns = [
-            r'(?:should|could|might|will) (?:be|have|get|see|play) (?:\w+ ){0,5}(?:points|fantasy|production)',
-            r'(?:high|low|big|good|bad) (?:week|game|matchup|performance) (?:for|against)',
-            r'(?:over|under) (?:performing|producing|expected)',
-            r'(?:favorite|sleepers?|chalk|value) (?:play|player|pick)',
-            r'(?:ownership|correlation|stack|leverage) (?:percentage|rate|score)'
-        ]
+        try:
+            from sentence_transformers import export_dynamic_quantized_onnx_model
+
+            if not os.path.isdir(quantized_dir):
+                model = SentenceTransformer('all-MiniLM-L6-v2', backend='onnx')
+                export_dynamic_quantized_onnx_model(model, 'avx512_vnni', quantized_dir)
+
+            return SentenceTransformer(
+                quantized_dir,
+                backend='onnx',
+                model_kwargs={'provider': 'CPUExecutionProvider'}
+            )
+
+        except Exception as e:
+            logger.warning("Falling back to FP32 embedding model", error=str(e))
+            return SentenceTransformer('all-MiniLM-L6-v2')
 
     async def process_podcast_transcript(self, podcast_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -73,23 +291,36 @@ class ContentVectorProcessor:
             if not transcript:
                 return podcast_data
 
-            # Extract fantasy insights from transcript
-            insights = self._extract_fantasy_insights(transcript)
+            # Split once; insight extraction and metrics share the result
+            sentences = self._split_into_sentences(transcript)
+
+            # Extract fantasy insights, then collapse near-duplicate
+            # takes the hosts repeat across an episode
+            insights = self._dedupe_insights(
+                self._extract_fantasy_insights_from_sentences(sentences)
+            )
 
             # Categorize insights by type
             categorized_insights = self._categorize_insights(insights)
 
             # Calculate transcript metrics
-            metrics = self._calculate_transcript_metrics(transcript, insights)
-
-            # Prepare processed data
-            processed_data = podcast_data.copy()
-            processed_data.update({
+            metrics = self._calculate_transcript_metrics(sentences, insights)
+
+            # Build a lean dict with just the fields consumed downstream
+            # rather than shallow-copying the whole payload
+            processed_data = {
+                'team_name': podcast_data.get('team_name', ''),
+                'episode_title': podcast_data.get('episode_title', ''),
+                'publish_date': podcast_data.get('publish_date', ''),
+                'duration': podcast_data.get('duration', ''),
+                'podcast_id': podcast_data.get('podcast_id', ''),
+                'episode_id': podcast_data.get('episode_id', ''),
+                'transcript': transcript,
                 'insights': categorized_insights,
                 'metrics': metrics,
                 'processed_at': datetime.now(timezone.utc).isoformat(),
                 'fantasy_relevance_score': self._calculate_relevance_score(insights, metrics)
-            })
+            }
 
             logger.info("Podcast transcript processed",
                        team=podcast_data.get('team_name', ''),
@@ -102,75 +333,170 @@ class ContentVectorProcessor:
             logger.error("Error processing podcast transcript", error=str(e))
             return podcast_data
 
-    def _extract_fantasy_insights(self, transcript: str) -> List[Dict[str, Any]]:
+    def _extract_fantasy_insights_from_sentences(self, sentences: List[str]) -> List[Dict[str, Any]]:
         """
-        Extract fantasy-relevant insights from podcast transcript.
+        Extract fantasy-relevant insights from pre-split transcript sentences.
         Focuses on qualitative statements that could impact DFS performance.
         """
-        insights = []
+        if not sentences:
+            return []
 
-        # Split transcript into sentences for analysis
-        sentences = self._split_into_sentences(transcript)
+        lowered = [sentence.translate(_LOWER_TABLE).strip() for sentence in sentences]
+        n = len(lowered)
 
-        for i, sentence in enumerate(sentences):
-            sentence_lower = sentence.lower().strip()
+        # Large batches go through the compiled kernel; otherwise score
+        # every sentence in one sparse matrix-vector product
+        use_jit = njit is not None and n > _JIT_SENTENCE_THRESHOLD
+        if use_jit:
+            keyword_scores = self._score_sentences_jit(lowered)
+        else:
+            term_matrix = self._kw_vectorizer.transform(lowered)
+            keyword_scores = np.asarray(term_matrix @ self._kw_weights).ravel()
+
+        dfs_hits = np.fromiter(
+            (len(self._dfs_re.findall(s)) for s in lowered), dtype=np.float64, count=n
+        )
+        player_indicators = np.fromiter(
+            (self._contains_player_indicators(s) for s in lowered), dtype=np.float64, count=n
+        )
+        word_counts = np.fromiter(
+            (len(s.split()) for s in lowered), dtype=np.int64, count=n
+        )
+        length_bonus = (word_counts >= 5) & (word_counts <= 50)
+
+        scores = np.minimum(
+            keyword_scores + 0.6 * dfs_hits + 0.2 * player_indicators + 0.1 * length_bonus,
+            1.0
+        )
+
+        # Top 20 most relevant via partial selection; only those take the
+        # per-sentence Python path at all
+        candidate_idx = np.flatnonzero(scores > 0.4)
+        if candidate_idx.size > 20:
+            top = np.argpartition(-scores[candidate_idx], 20)[:20]
+            candidate_idx = candidate_idx[top]
+        candidate_idx = candidate_idx[np.argsort(-scores[candidate_idx], kind='stable')]
+
+        if use_jit:
+            # Scalar categorization/sentiment for the few survivors
+            candidate_categories = [self._identify_categories(lowered[i]) for i in candidate_idx]
+            candidate_sentiments = [self._analyze_sentiment(lowered[i]) for i in candidate_idx]
+        else:
+            sentiment_matrix = self._sentiment_vectorizer.transform(lowered)
+            positive_counts = np.asarray(
+                sentiment_matrix[:, :self._n_positive].sum(axis=1)
+            ).ravel()
+            negative_counts = np.asarray(
+                sentiment_matrix[:, self._n_positive:].sum(axis=1)
+            ).ravel()
+            sentiments = np.where(
+                positive_counts > negative_counts, 'positive',
+                np.where(negative_counts > positive_counts, 'negative', 'neutral')
+            )
+
+            category_hits = {
+                category: np.asarray(term_matrix[:, sl].sum(axis=1)).ravel() > 0
+                for category, sl in self._kw_category_slices.items()
+            }
+            candidate_categories = [
+                [c for c, hits in category_hits.items() if hits[i]] for i in candidate_idx
+            ]
+            candidate_sentiments = [str(sentiments[i]) for i in candidate_idx]
+
+        return [
+            {
+                'content': sentences[i].strip(),
+                'sentence_index': int(i),
+                'relevance_score': float(scores[i]),
+                'categories': categories,
+                'mentioned_players': self._extract_player_mentions(sentences[i]),
+                'mentioned_teams': self._extract_team_mentions(sentences[i]),
+                'sentiment': sentiment,
+                'context_window': self._get_context_window(sentences, i)
+            }
+            for i, categories, sentiment in zip(
+                candidate_idx, candidate_categories, candidate_sentiments
+            )
+        ]
+
+    def _score_sentences_jit(self, lowered: List[str]) -> np.ndarray:
+        """
+        Keyword scoring through the compiled kernel: map tokens (and
+        adjacent bigrams) to keyword ids once in Python, then let the
+        parallel kernel accumulate per-sentence keyword weights.
+        """
+        unigrams, bigrams, weights = _keyword_id_tables()
+
+        tok_ids = []
+        offsets = [0]
+        for sentence in lowered:
+            tokens = self._tok_re.findall(sentence)
+            prev = None
+            for token in tokens:
+                tok_ids.append(unigrams.get(token, -1))
+                if prev is not None:
+                    bigram_id = bigrams.get((prev, token), -1)
+                    if bigram_id >= 0:
+                        tok_ids.append(bigram_id)
+                prev = token
+            offsets.append(len(tok_ids))
+
+        return _keyword_score_kernel(
+            np.asarray(tok_ids, dtype=np.int64),
+            np.asarray(offsets, dtype=np.int64),
+            weights,
+            len(weights)
+        )
+
+    def _embed_sentences(self, sentences: List[str]) -> np.ndarray:
+        """
+        Encode sentences in one batched call instead of per sentence.
+        Cache misses are sorted by length before encoding so batches pad
+        to similar sizes, then scattered back to the original order.
+        """
+        if not sentences:
+            return np.empty((0, 0), dtype=np.float32)
 
-            # Check for fantasy-relevant keywords
-            relevance_score = self._calculate_sentence_relevance(sentence_lower)
+        embeddings = [self._emb_cache.get(s) for s in sentences]
+        miss_idx = [i for i, emb in enumerate(embeddings) if emb is None]
 
-            if relevance_score > 0.3:  # Threshold for inclusion
-                insight = {
-                    'content': sentence.strip(),
-                    'sentence_index': i,
-                    'relevance_score': relevance_score,
-                    'categories': self._identify_categories(sentence_lower),
-                    'mentioned_players': self._extract_player_mentions(sentence),
-                    'mentioned_teams': self._extract_team_mentions(sentence),
-                    'sentiment': self._analyze_sentiment(sentence),
-                    'context_window': self._get_context_window(sentences, i)
-                }
-                insights.append(insight)
+        if miss_idx:
+            miss_idx.sort(key=lambda i: len(sentences[i]), reverse=True)
+            encoded = self.embedding_model.encode(
+                [sentences[i] for i in miss_idx],
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
 
-        # Filter and rank insights
-        insights = [insight for insight in insights if insight['relevance_score'] > 0.4]
-        insights.sort(key=lambda x: x['relevance_score'], reverse=True)
+            if len(self._emb_cache) + len(miss_idx) > self._emb_cache_limit:
+                self._emb_cache.clear()
 
-        return insights[:20]  # Top 20 most relevant insights
+            for i, emb in zip(miss_idx, encoded):
+                self._emb_cache[sentences[i]] = emb
+                embeddings[i] = emb
 
-    def _calculate_sentence_relevance(self, sentence: str) -> float:
+        return np.vstack(embeddings)
+
+    def _dedupe_insights(self, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Calculate how relevant a sentence is to fantasy football.
+        Drop insights that are near-duplicates of a higher-scored one.
+        Embeddings are unit-normalized, so cosine similarity is a plain
+        dot product; insights arrive score-descending, so the strongest
+        phrasing of a repeated take is the one that survives.
         """
-        score = 0.0
+        if len(insights) < 2:
+            return insights
 
-        # Check for fantasy keywords
-        for category, keywords in self.fantasy_keywords.items():
-            for keyword in keywords:
-                if keyword in sentence:
-                    if category == 'performance':
-                        score += 0.4
-                    elif category == 'health':
-                        score += 0.5  # Health is very important for DFS
-                    elif category == 'situational':
-                        score += 0.3
-                    elif category == 'team_dynamics':
-                        score += 0.2
-
-        # Check for DFS-specific patterns
-        for pattern in self.dfs_patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                score += 0.6
-
-        # Boost score for player mentions
-        if self._contains_player_indicators(sentence):
-            score += 0.2
-
-        # Length consideration (avoid very short or very long sentences)
-        word_count = len(sentence.split())
-        if 5 <= word_count <= 50:
-            score += 0.1
-
-        return min(score, 1.0)  # Cap at 1.0
+        embeddings = self._embed_sentences([insight['content'] for insight in insights])
+
+        kept: List[int] = [0]
+        for i in range(1, len(insights)):
+            if float(np.max(embeddings[kept] @ embeddings[i])) < _INSIGHT_DEDUPE_THRESHOLD:
+                kept.append(i)
+
+        return [insights[i] for i in kept]
 
     def _identify_categories(self, sentence: str) -> List[str]:
         """
@@ -210,40 +536,17 @@ class ContentVectorProcessor:
         """
         Extract mentioned NFL team names from sentence.
         """
-        # NFL team name patterns
-        team_keywords = [
-            'chiefs', 'chargers', 'raiders', 'broncos',
-            'patriots', 'jets', 'bills', 'dolphins',
-            'packers', 'vikings', 'bears', 'lions',
-            'cowboys', 'eagles', 'giants', 'commanders',
-            'buccaneers', 'falcons', 'panthers', 'saints',
-            'steelers', 'ravens', 'bengals', 'browns',
-            'titans', 'colts', 'jaguars', 'texans',
-            'seahawks', 'rams', 'cardinals', '49ers'
-        ]
-
-        teams = []
-        sentence_lower = sentence.lower()
-
-        for team in team_keywords:
-            if team in sentence_lower:
-                teams.append(team.title())
-
-        return list(set(teams))
+        tokens = frozenset(self._tok_re.findall(sentence.lower()))
+        return [team.title() for team in self._team_set & tokens]
 
     def _analyze_sentiment(self, sentence: str) -> str:
         """
         Simple sentiment analysis for fantasy context.
         """
-        positive_words = ['great', 'excellent', 'outstanding', 'fantastic', 'amazing',
-                         'impressive', 'strong', 'dominant', 'explosive', 'elite']
-        negative_words = ['worried', 'concerned', 'struggling', 'poor', 'weak',
-                         'disappointing', 'injured', 'questionable', 'doubtful']
-
-        sentence_lower = sentence.lower()
+        tokens = frozenset(self._tok_re.findall(sentence.lower()))
 
-        positive_count = sum(1 for word in positive_words if word in sentence_lower)
-        negative_count = sum(1 for word in negative_words if word in sentence_lower)
+        positive_count = len(self._positive_set & tokens)
+        negative_count = len(self._negative_set & tokens)
 
         if positive_count > negative_count:
             return 'positive'
@@ -281,12 +584,12 @@ class ContentVectorProcessor:
 
         return categories
 
-    def _calculate_transcript_metrics(self, transcript: str, insights: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _calculate_transcript_metrics(self, sentences: List[str], insights: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Calculate metrics about the transcript's fantasy relevance.
         """
-        total_words = len(transcript.split())
-        total_sentences = len(self._split_into_sentences(transcript))
+        total_words = sum(len(s.split()) for s in sentences)
+        total_sentences = len(sentences)
 
         return {
             'total_words': total_words,
@@ -318,25 +621,24 @@ class ContentVectorProcessor:
 
         return min(total_score, 1.0)
 
-    def _contains_player_indicators(self, sentence: str) -> bool:
+    def _contains_player_indicators(self, sentence_lower: str) -> bool:
         """
         Check if sentence likely contains player references.
+        Expects already-lowercased text; every call site passes it.
         """
-        indicators = [
-            'quarterback', 'qb', 'running back', 'rb', 'wide receiver', 'wr',
-            'tight end', 'te', 'offensive line', 'ol', 'defensive line', 'dl',
-            'linebacker', 'lb', 'defensive back', 'db', 'safety', 'cornerback'
-        ]
+        tokens = frozenset(self._tok_re.findall(sentence_lower))
+
+        if self._player_indicator_set & tokens:
+            return True
 
-        sentence_lower = sentence.lower()
-        return any(indicator in sentence_lower for indicator in indicators)
+        return any(phrase in sentence_lower for phrase in self._player_indicator_phrases)
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """
         Split text into sentences for analysis.
         """
         # Simple sentence splitting (could be improved with NLTK)
-        sentences = re.split(r'[.!?]+', text)
+        sentences = self._sentence_splitter.split(text)
         return [s.strip() for s in sentences if s.strip()]
 
     async def process_news_article(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -353,12 +655,16 @@ class ContentVectorProcessor:
             # Check fantasy relevance
             fantasy_relevance = self._calculate_news_relevance(content, title)
 
-            processed_data = article_data.copy()
-            processed_data.update({
+            processed_data = {
+                'title': title,
+                'source': article_data.get('source', ''),
+                'publish_date': article_data.get('publish_date', ''),
+                'content': content,
                 'sentiment': sentiment,
+                'sentiment_score': sentiment.get('score', 0.0),
                 'fantasy_relevance': fantasy_relevance,
                 'processed_at': datetime.now(timezone.utc).isoformat()
-            })
+            }
 
             return processed_data
 
@@ -371,13 +677,10 @@ class ContentVectorProcessor:
         Analyze sentiment of news content.
         """
         # Simple sentiment analysis (could be enhanced with better models)
-        positive_indicators = ['upgrade', 'healthy', 'returning', 'expected', 'confident']
-        negative_indicators = ['downgrade', 'injury', 'concerned', 'doubtful', 'questionable']
-
-        content_lower = content.lower()
+        tokens = frozenset(self._tok_re.findall(content.lower()))
 
-        positive_score = sum(1 for word in positive_indicators if word in content_lower)
-        negative_score = sum(1 for word in negative_indicators if word in content_lower)
+        positive_score = len(self._positive_news_set & tokens)
+        negative_score = len(self._negative_news_set & tokens)
 
         if positive_score > negative_score:
             return {'label': 'positive', 'score': 0.7}
@@ -391,21 +694,19 @@ class ContentVectorProcessor:
         Calculate how relevant news is to fantasy football.
         """
         combined_text = f"{title} {content}".lower()
+        tokens = frozenset(self._tok_re.findall(combined_text))
 
         relevance_score = 0.0
 
         # Fantasy keywords
-        fantasy_terms = ['fantasy', 'dfs', 'ownership', 'projection', 'points']
-        for term in fantasy_terms:
-            if term in combined_text:
-                relevance_score += 0.3
+        relevance_score += 0.3 * len(self._fantasy_term_set & tokens)
 
         # Player/team mentions
         if self._contains_player_indicators(combined_text):
             relevance_score += 0.2
 
         # Injury/health mentions
-        if any(word in combined_text for word in ['injury', 'healthy', 'practice', 'ir']):
+        if self._health_term_set & tokens:
             relevance_score += 0.4
 
         return min(relevance_score, 1.0)
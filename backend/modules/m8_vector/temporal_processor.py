@@ -1,11 +1,55 @@
 # Temporal Processor for ATHENA v2.2
 import time
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone, timedelta
 import structlog
 
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
 logger = structlog.get_logger()
 
+_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d',
+    '%m/%d/%Y',
+    '%B %d, %Y'
+)
+
+# Structural dispatch keyed on (length, separator at index 4) picks the
+# right format directly, skipping exception-driven probing on hot shapes
+_DATE_DISPATCH = {
+    (10, '-'): '%Y-%m-%d',
+    (19, '-'): '%Y-%m-%d %H:%M:%S',
+    (10, '/'): '%Y/%m/%d'
+}
+
+
+@dataclass
+class SearchResultsBatch:
+    """
+    Structure-of-arrays view over a list of search result dicts.
+    The scoring passes operate on these parallel arrays; the original
+    payload dicts are only touched when results are written back.
+    """
+    results: List[Dict[str, Any]]
+    age_days: np.ndarray
+    date_valid: np.ndarray
+    type_known: np.ndarray
+    half_lives: np.ndarray
+    max_ages: np.ndarray
+    semantic: np.ndarray
+    health_podcast: np.ndarray
+    strong_sentiment: np.ndarray
+    temporal: Optional[np.ndarray] = None
+    combined: Optional[np.ndarray] = None
+
 
 class TemporalVectorProcessor:
     """
@@ -26,33 +70,89 @@ class TemporalVectorProcessor:
             }
         }
 
-    def apply_temporal_scoring(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _to_batch(self, search_results: List[Dict[str, Any]],
+                  now: Optional[datetime] = None) -> SearchResultsBatch:
         """
-        Apply temporal relevance scoring to search results.
-        More recent content gets higher temporal scores.
+        Convert a result list into parallel arrays in a single pass.
         """
-        current_time = datetime.now(timezone.utc)
-
-        for result in search_results:
+        current_time = now or datetime.now(timezone.utc)
+        n = len(search_results)
+
+        ages = np.zeros(n)
+        half_lives = np.ones(n)
+        max_ages = np.zeros(n)
+        date_valid = np.zeros(n, dtype=bool)
+        type_known = np.zeros(n, dtype=bool)
+        semantic = np.empty(n)
+        health_podcast = np.zeros(n, dtype=bool)
+        strong_sentiment = np.zeros(n, dtype=bool)
+
+        for i, result in enumerate(search_results):
             content_type = result.get('content_type', 'unknown')
-            publish_date_str = result.get('publish_date', '')
-
-            # Parse publish date
-            publish_date = self._parse_date(publish_date_str)
-            if not publish_date:
-                result['temporal_score'] = 0.5  # Default neutral score
-                continue
+            config = self.decay_factors.get(content_type)
+            if config is not None:
+                type_known[i] = True
+                half_lives[i] = config['half_life_days']
+                max_ages[i] = config['max_age_days']
 
-            # Calculate age in days
-            age_days = (current_time - publish_date).days
-
-            # Calculate temporal relevance score
-            temporal_score = self._calculate_temporal_relevance(
-                age_days, content_type
+            publish_date = self._parse_date(result.get('publish_date', ''))
+            if publish_date:
+                date_valid[i] = True
+                ages[i] = (current_time - publish_date).days
+
+            semantic[i] = result.get('relevance_score', 0.5)
+            health_podcast[i] = (
+                content_type == 'podcast_transcript'
+                and 'health' in result.get('categories', [])
             )
+            strong_sentiment[i] = result.get('sentiment', 'neutral') in ('positive', 'negative')
+
+        return SearchResultsBatch(
+            results=search_results,
+            age_days=ages,
+            date_valid=date_valid,
+            type_known=type_known,
+            half_lives=half_lives,
+            max_ages=max_ages,
+            semantic=semantic,
+            health_podcast=health_podcast,
+            strong_sentiment=strong_sentiment
+        )
+
+    def _score_batch(self, batch: SearchResultsBatch) -> None:
+        """Fill batch.temporal from the age and decay-parameter arrays"""
+        decay = np.exp2(-batch.age_days / batch.half_lives)
+        scores = 0.1 + decay * 0.9
+        scores[batch.age_days > batch.max_ages] = 0.1  # Very low score for stale content
+        batch.temporal = np.where(batch.date_valid & batch.type_known, scores, 0.5)
+
+    def _combine_batch(self, batch: SearchResultsBatch) -> None:
+        """Weighted combination (60% semantic, 40% temporal)"""
+        batch.combined = batch.semantic * 0.6 + batch.temporal * 0.4
+
+    def _boost_batch(self, batch: SearchResultsBatch) -> None:
+        """Very recent (last 24h) 1.3x, health insights 1.2x, sentiment 1.1x"""
+        boost = np.where(batch.age_days < 1, 1.3, 1.0)
+        boost = boost * np.where(batch.health_podcast, 1.2, 1.0)
+        boost = boost * np.where(batch.strong_sentiment, 1.1, 1.0)
+        batch.combined = batch.combined * boost
+
+    def apply_temporal_scoring(self, search_results: List[Dict[str, Any]],
+                               now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Apply temporal relevance scoring to search results.
+        More recent content gets higher temporal scores.
+        """
+        if not search_results:
+            return search_results
 
-            result['temporal_score'] = temporal_score
-            result['age_days'] = age_days
+        batch = self._to_batch(search_results, now)
+        self._score_batch(batch)
+
+        for i, result in enumerate(search_results):
+            result['temporal_score'] = float(batch.temporal[i])
+            if batch.date_valid[i]:
+                result['age_days'] = int(batch.age_days[i])
 
         return search_results
 
@@ -85,20 +185,60 @@ class TemporalVectorProcessor:
         """
         Combine semantic similarity with temporal relevance for final ranking.
         """
-        for result in search_results:
-            semantic_score = result.get('relevance_score', 0.5)
-            temporal_score = result.get('temporal_score', 0.5)
+        if not search_results:
+            return search_results
+
+        n = len(search_results)
+        semantic = np.fromiter(
+            (r.get('relevance_score', 0.5) for r in search_results), dtype=np.float64, count=n
+        )
+        temporal = np.fromiter(
+            (r.get('temporal_score', 0.5) for r in search_results), dtype=np.float64, count=n
+        )
 
-            # Weighted combination (60% semantic, 40% temporal)
-            combined_score = (semantic_score * 0.6) + (temporal_score * 0.4)
+        # Weighted combination (60% semantic, 40% temporal)
+        combined = semantic * 0.6 + temporal * 0.4
 
-            result['combined_score'] = combined_score
+        for result, score in zip(search_results, combined):
+            result['combined_score'] = float(score)
 
         # Sort by combined score
-        search_results.sort(key=lambda x: x.get('combined_score', 0), reverse=True)
+        order = np.argsort(-combined, kind='stable')
+        search_results[:] = [search_results[i] for i in order]
 
         return search_results
 
+    def score_rank_and_filter(self, search_results: List[Dict[str, Any]],
+                              max_age_days: int = 30,
+                              now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Fused pipeline: temporal scoring, score combination, recency and
+        impact boosts, freshness filter, and final ranking in one batch
+        pass instead of four list walks. Pure CPU work — callers on the
+        event loop should run it via asyncio.to_thread.
+        """
+        if not search_results:
+            return []
+
+        batch = self._to_batch(search_results, now)
+        self._score_batch(batch)
+        self._combine_batch(batch)
+        self._boost_batch(batch)
+
+        keep = np.flatnonzero(batch.age_days <= max_age_days)
+        order = keep[np.argsort(-batch.combined[keep], kind='stable')]
+
+        ranked = []
+        for i in order:
+            result = batch.results[i]
+            result['temporal_score'] = float(batch.temporal[i])
+            result['combined_score'] = float(batch.combined[i])
+            if batch.date_valid[i]:
+                result['age_days'] = int(batch.age_days[i])
+            ranked.append(result)
+
+        return ranked
+
     def filter_by_freshness(self, search_results: List[Dict[str, Any]], max_age_days: int = 30) -> List[Dict[str, Any]]:
         """
         Filter out results that are too old.
@@ -116,30 +256,34 @@ class TemporalVectorProcessor:
         """
         Apply additional boost to very recent content and high-impact insights.
         """
-        current_time = datetime.now(timezone.utc)
-
-        for result in search_results:
-            boost_multiplier = 1.0
-
-            # Boost for very recent content (last 24 hours)
-            age_days = result.get('age_days', 0)
-            if age_days < 1:
-                boost_multiplier *= 1.3
-
-            # Boost for health-related insights
-            if result.get('content_type') == 'podcast_transcript':
-                categories = result.get('categories', [])
-                if 'health' in categories:
-                    boost_multiplier *= 1.2
-
-            # Boost for high sentiment impact
-            sentiment = result.get('sentiment', 'neutral')
-            if sentiment in ['positive', 'negative']:
-                boost_multiplier *= 1.1
-
-            # Apply boost to combined score
+        if not search_results:
+            return search_results
+
+        n = len(search_results)
+        ages = np.fromiter(
+            (r.get('age_days', 0) for r in search_results), dtype=np.float64, count=n
+        )
+        health_podcast = np.fromiter(
+            (
+                r.get('content_type') == 'podcast_transcript'
+                and 'health' in r.get('categories', [])
+                for r in search_results
+            ),
+            dtype=bool, count=n
+        )
+        strong_sentiment = np.fromiter(
+            (r.get('sentiment', 'neutral') in ('positive', 'negative') for r in search_results),
+            dtype=bool, count=n
+        )
+
+        # Very recent (last 24h) 1.3x, health insights 1.2x, sentiment 1.1x
+        boost = np.where(ages < 1, 1.3, 1.0)
+        boost = boost * np.where(health_podcast, 1.2, 1.0)
+        boost = boost * np.where(strong_sentiment, 1.1, 1.0)
+
+        for result, multiplier in zip(search_results, boost):
             if 'combined_score' in result:
-                result['combined_score'] *= boost_multiplier
+                result['combined_score'] *= float(multiplier)
 
         return search_results
 
@@ -147,52 +291,57 @@ class TemporalVectorProcessor:
         """
         Analyze the age distribution of search results.
         """
-        age_ranges = {
-            'very_recent': 0,  # < 1 day
-            'recent': 0,       # 1-3 days
-            'this_week': 0,    # 4-7 days
-            'this_month': 0,   # 8-30 days
-            'older': 0         # > 30 days
-        }
+        labels = ('very_recent', 'recent', 'this_week', 'this_month', 'older')
 
-        for result in search_results:
-            age_days = result.get('age_days', 0)
+        if not search_results:
+            return dict.fromkeys(labels, 0)
 
-            if age_days < 1:
-                age_ranges['very_recent'] += 1
-            elif age_days < 4:
-                age_ranges['recent'] += 1
-            elif age_days < 8:
-                age_ranges['this_week'] += 1
-            elif age_days < 31:
-                age_ranges['this_month'] += 1
-            else:
-                age_ranges['older'] += 1
+        # One vectorized bucketing pass: <1, 1-3, 4-7, 8-30, >30 days
+        ages = np.fromiter(
+            (r.get('age_days', 0) for r in search_results),
+            dtype=np.float64, count=len(search_results)
+        )
+        bins = np.digitize(ages, [1, 4, 8, 31])
+        counts = np.bincount(bins, minlength=5)
 
-        return age_ranges
+        return dict(zip(labels, counts.tolist()))
 
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _parse_date(date_str: str) -> Optional[datetime]:
         """
-        Parse date string into datetime object.
+        Parse date string into a UTC datetime object.
+        Memoized: the same publish_date is parsed once per process, and
+        ISO-shaped strings go through ciso8601's C parser when installed.
         """
         if not date_str:
             return None
 
         try:
+            if ciso8601 is not None:
+                try:
+                    parsed = ciso8601.parse_datetime(date_str)
+                    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+                except ValueError:
+                    pass
+
             # Try ISO format first
             if 'T' in date_str:
-                return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+            # Dispatch on shape before exception-driven format probing
+            fmt = _DATE_DISPATCH.get(
+                (len(date_str), date_str[4] if len(date_str) > 4 else '')
+            )
+            if fmt is not None:
+                try:
+                    return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
+                except ValueError:
+                    pass
 
             # Try common date formats
-            formats = [
-                '%Y-%m-%d',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y/%m/%d',
-                '%m/%d/%Y',
-                '%B %d, %Y'
-            ]
-
-            for fmt in formats:
+            for fmt in _DATE_FORMATS:
                 try:
                     return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
                 except ValueError:
@@ -251,26 +400,30 @@ class TemporalVectorProcessor:
 
         return velocity_stats
 
-    def predict_relevance_trend(self, search_results: List[Dict[str, Any]], days_ahead: int = 7) -> Dict[str, Any]:
+    def predict_relevance_trend(self, search_results: List[Dict[str, Any]], days_ahead: int = 7,
+                                now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Predict how relevance scores might trend in the future.
         """
-        current_time = datetime.now(timezone.utc)
+        current_time = now or datetime.now(timezone.utc)
 
         # Group by content type
         trends = {}
 
         for result in search_results:
             content_type = result.get('content_type', 'unknown')
-            publish_date = self._parse_date(result.get('publish_date', ''))
 
-            if not publish_date:
-                continue
+            # Reuse the age computed by the scoring pass when present
+            age_days = result.get('age_days')
+            if age_days is None:
+                publish_date = self._parse_date(result.get('publish_date', ''))
+                if not publish_date:
+                    continue
+                age_days = (current_time - publish_date).days
 
             if content_type not in trends:
                 trends[content_type] = []
 
-            age_days = (current_time - publish_date).days
             relevance = result.get('relevance_score', 0.5)
 
             trends[content_type].append({
@@ -287,19 +440,21 @@ class TemporalVectorProcessor:
                 continue
 
             # Simple linear trend calculation
-            x_values = [point['age_days'] for point in data_points]
-            y_values = [point['relevance'] for point in data_points]
+            n = len(data_points)
+            x = np.fromiter((point['age_days'] for point in data_points), dtype=np.float64, count=n)
+            y = np.fromiter((point['relevance'] for point in data_points), dtype=np.float64, count=n)
 
-            # Calculate slope (trend)
-            n = len(x_values)
-            slope = sum((x - sum(x_values)/n) * (y - sum(y_values)/n) for x, y in zip(x_values, y_values))
-            slope /= sum((x - sum(x_values)/n) ** 2 for x in x_values) if x_values else 0
+            # Closed-form least squares; flat when all ages are identical
+            if np.ptp(x) == 0:
+                slope = 0.0
+            else:
+                slope = float(np.polyfit(x, y, 1)[0])
 
             # Predict future relevance
-            future_relevance = y_values[-1] + (slope * days_ahead)
+            future_relevance = float(y[-1]) + (slope * days_ahead)
 
             predictions[content_type] = {
-                'current_avg_relevance': sum(y_values) / len(y_values),
+                'current_avg_relevance': float(y.mean()),
                 'trend_slope': slope,
                 'predicted_relevance': max(0, min(1, future_relevance)),
                 'trend_direction': 'increasing' if slope > 0 else 'decreasing' if slope < 0 else 'stable'
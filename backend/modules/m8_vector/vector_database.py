@@ -1,9 +1,15 @@
 ﻿# Vector Database Manager for ATHENA v2.2
 import asyncio
+import hashlib
 import json
+import os
+import re
+import threading
+import time
 import uuid
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
+import numpy as np
 import structlog
 
 try:
@@ -16,82 +22,613 @@ except ImportError:
     SentenceTransformer = None
 
 from shared.config import settings
+from shared.database import redis_client
 
 logger = structlog.get_logger()
 
+# Raw float32 embeddings keyed by content hash live for a week so every
+# worker shares one encode per unique text
+_EMB_CACHE_TTL = 7 * 86400
+
+# MiniLM reads at most 256 wordpieces, so tokenizing a full transcript is
+# wasted work; this comfortably covers the model's window
+_EMBED_WINDOW_CHARS = 2048
+
+_WORD_RE = re.compile(r'\S+')
+
+
+def _iso(ts: float) -> str:
+    """Render a stored epoch timestamp as ISO-8601 on demand."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def _as_float(value: Any) -> float:
+    """Coerce feed values to a numeric metadata column, 0.0 when unparseable."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+_embedding_model = None
+
+
+def get_embedding_model():
+    """Process-wide MiniLM instance: FP16 on CUDA, INT8 ONNX on CPU.
+
+    The export lands in <vector_db_path>/onnx-int8 and is shared with the
+    content processor, so only the first process ever pays the export cost.
+    FP32 PyTorch remains available via settings.embedding_precision='fp32'
+    or as the fallback when ONNX runtime support is missing.
+    """
+    global _embedding_model
+    if _embedding_model is not None:
+        return _embedding_model
+
+    # A GPU beats the quantized CPU path; FP16 doubles matmul throughput
+    # on tensor cores with cosine deltas well below retrieval noise.
+    try:
+        import torch
+        if torch.cuda.is_available():
+            model = SentenceTransformer('all-MiniLM-L6-v2', device='cuda')
+            model.half()
+            _embedding_model = model
+            return _embedding_model
+    except ImportError:
+        pass
+
+    if settings.embedding_precision == 'fp32':
+        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        return _embedding_model
+
+    quantized_dir = os.path.join(settings.vector_db_path, 'onnx-int8')
+    try:
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        if not os.path.isdir(quantized_dir):
+            model = SentenceTransformer('all-MiniLM-L6-v2', backend='onnx')
+            export_dynamic_quantized_onnx_model(model, 'avx512_vnni', quantized_dir)
+
+        _embedding_model = SentenceTransformer(
+            quantized_dir,
+            backend='onnx',
+            model_kwargs={'provider': 'CPUExecutionProvider'}
+        )
+    except Exception as e:
+        logger.warning('INT8 ONNX embedding model unavailable, using FP32', error=str(e))
+        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+    return _embedding_model
+
 
 class VectorDatabaseManager:
     def __init__(self):
         if not VECTOR_DEPS_AVAILABLE:
             raise ImportError('Vector dependencies not available. Install chromadb and sentence-transformers.')
 
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.embedding_model = get_embedding_model()
         self.chroma_client = chromadb.PersistentClient(path=settings.vector_db_path)
-        self.podcast_collection = self.chroma_client.get_or_create_collection(
-            name='podcast_insights',
-            metadata={'description': 'NFL DFS insights from podcast transcripts'}
+        # Cosine space + unit vectors at ingest means distances reduce to
+        # SIMD inner products and 1 - distance is exact cosine similarity
+        self.podcast_collection = self._ensure_cosine_collection(
+            'podcast_insights', 'NFL DFS insights from podcast transcripts'
+        )
+        self.news_collection = self._ensure_cosine_collection(
+            'news_sentiment', 'News articles with sentiment analysis'
+        )
+        # Bounds concurrent model forward passes so worker threads don't thrash
+        self._model_semaphore = asyncio.Semaphore(4)
+        # Repeated queries skip the model forward pass entirely
+        self._query_emb_cache: Dict[str, np.ndarray] = {}
+        self._query_emb_cache_limit = 1024
+        # Near-duplicate queries (paraphrases) reuse whole result sets
+        self._sem_cache_lock = threading.Lock()
+        self._sem_cache_emb: Optional[np.ndarray] = None
+        self._sem_cache_payloads: List[Any] = []
+        self._sem_cache_pos = 0
+        self._sem_cache_size = 512
+        self._sem_cache_threshold = 0.97
+        # Coalescing write queue: concurrent stores share one encode and
+        # one ChromaDB transaction per flush
+        self._pending_podcasts: List[Any] = []
+        self._pending_news: List[Any] = []
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._flush_interval = 0.2
+        # In-process mirror of the podcast collection for brute-force scans
+        self._mat_lock = threading.Lock()
+        self._podcast_mat: Optional[np.ndarray] = None
+        self._podcast_ids: List[str] = []
+        self._podcast_docs: List[str] = []
+        self._podcast_metas: List[Dict[str, Any]] = []
+
+    def _ensure_cosine_collection(self, name: str, description: str):
+        """Get or create a collection indexed in cosine space.
+
+        Chroma only applies hnsw:space at creation time, so a collection
+        created before the cosine switch silently stays on L2 while the
+        1 - distance scoring assumes cosine. Detect that case and reindex
+        once: pull the rows, recreate the collection in cosine space, and
+        re-add with unit-normalized embeddings.
+        """
+        metadata = {'description': description, 'hnsw:space': 'cosine'}
+        collection = self.chroma_client.get_or_create_collection(
+            name=name, metadata=metadata
         )
-        self.news_collection = self.chroma_client.get_or_create_collection(
-            name='news_sentiment',
-            metadata={'description': 'News articles with sentiment analysis'}
+        space = (collection.metadata or {}).get('hnsw:space', 'l2')
+        if space == 'cosine':
+            return collection
+
+        logger.warning('Reindexing collection into cosine space',
+                       collection=name, previous_space=space)
+        data = collection.get(include=['embeddings', 'documents', 'metadatas'])
+        self.chroma_client.delete_collection(name)
+        collection = self.chroma_client.get_or_create_collection(
+            name=name, metadata=metadata
         )
 
+        ids = data.get('ids') or []
+        if ids:
+            emb = np.asarray(data['embeddings'], dtype=np.float32)
+            emb = emb / np.maximum(np.linalg.norm(emb, axis=1, keepdims=True), 1e-12)
+            # Stay under Chroma's per-add batch limit on large collections
+            for start in range(0, len(ids), 5000):
+                end = start + 5000
+                collection.add(
+                    ids=ids[start:end],
+                    embeddings=emb[start:end],
+                    documents=data['documents'][start:end],
+                    metadatas=data['metadatas'][start:end]
+                )
+
+        return collection
+
+    def _podcast_matrix(self) -> np.ndarray:
+        """Hydrate and return the unit-normalized podcast embedding matrix.
+
+        At this collection's scale a single matmul beats the ChromaDB
+        query path, which spends most of its budget on IPC and filter
+        evaluation rather than distance math.
+        """
+        with self._mat_lock:
+            if self._podcast_mat is None:
+                data = self.podcast_collection.get(
+                    include=['embeddings', 'documents', 'metadatas']
+                )
+                emb = np.asarray(data['embeddings'], dtype=np.float32)
+                if emb.size:
+                    emb = emb / np.maximum(
+                        np.linalg.norm(emb, axis=1, keepdims=True), 1e-12
+                    )
+                else:
+                    emb = np.zeros((0, 0), dtype=np.float32)
+                self._podcast_mat = emb
+                self._podcast_ids = list(data['ids'])
+                self._podcast_docs = list(data['documents'])
+                self._podcast_metas = list(data['metadatas'])
+            return self._podcast_mat
+
+    def _mirror_podcast_rows(self, doc_ids: List[str], embeddings: np.ndarray,
+                             documents: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Keep the in-process mirror in sync with freshly stored rows."""
+        with self._mat_lock:
+            if self._podcast_mat is None:
+                return  # not hydrated yet; first search picks these up
+            unit = embeddings / np.maximum(
+                np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12
+            )
+            if self._podcast_mat.size:
+                self._podcast_mat = np.vstack((self._podcast_mat, unit))
+            else:
+                self._podcast_mat = unit
+            self._podcast_ids.extend(doc_ids)
+            self._podcast_docs.extend(documents)
+            self._podcast_metas.extend(metadatas)
+
+    def _brute_force_podcast_search(self, unit_embedding: np.ndarray, limit: int) -> List[Dict[str, Any]]:
+        matrix = self._podcast_matrix()
+        if matrix.size == 0:
+            return []
+        sims = matrix @ unit_embedding
+        k = min(limit, sims.shape[0])
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind='stable')]
+
+        formatted_results = []
+        for i in top:
+            doc = self._podcast_docs[i]
+            preview = doc[:500] + '...' if len(doc) > 500 else doc
+            formatted_results.append({
+                'doc_id': self._podcast_ids[i],
+                'content': preview,
+                'metadata': self._podcast_metas[i],
+                'similarity_score': float(sims[i])
+            })
+        return formatted_results
+
+    def _semantic_cache_get(self, query_embedding: np.ndarray, cache_key: Any) -> Any:
+        """Return cached results for a query whose embedding nearly matches a prior one."""
+        norm = np.linalg.norm(query_embedding)
+        unit = query_embedding / norm if norm > 0 else query_embedding
+        with self._sem_cache_lock:
+            if self._sem_cache_emb is None or not self._sem_cache_payloads:
+                return None, unit
+            sims = self._sem_cache_emb[:len(self._sem_cache_payloads)] @ unit
+            best = int(np.argmax(sims))
+            key, results = self._sem_cache_payloads[best]
+            if sims[best] >= self._sem_cache_threshold and key == cache_key:
+                return results, unit
+        return None, unit
+
+    def _semantic_cache_put(self, unit_embedding: np.ndarray, cache_key: Any, results: Any) -> None:
+        with self._sem_cache_lock:
+            if self._sem_cache_emb is None:
+                self._sem_cache_emb = np.zeros(
+                    (self._sem_cache_size, unit_embedding.shape[0]), dtype=np.float32
+                )
+            self._sem_cache_emb[self._sem_cache_pos] = unit_embedding
+            if len(self._sem_cache_payloads) <= self._sem_cache_pos:
+                self._sem_cache_payloads.append((cache_key, results))
+            else:
+                self._sem_cache_payloads[self._sem_cache_pos] = (cache_key, results)
+            self._sem_cache_pos = (self._sem_cache_pos + 1) % self._sem_cache_size
+
+    def _encode_query(self, query: str) -> np.ndarray:
+        cached = self._query_emb_cache.get(query)
+        if cached is not None:
+            return cached
+        embedding = self._cached_encode_batch([query])[0]
+        if len(self._query_emb_cache) >= self._query_emb_cache_limit:
+            self._query_emb_cache.clear()
+        self._query_emb_cache[query] = embedding
+        return embedding
+
+    def _encode_batch(self, contents: List[str]) -> np.ndarray:
+        """Encode a batch of texts, grouping similar lengths to cut padding waste.
+
+        Sorting by length means each encode mini-batch pads to the length of
+        texts that are actually similar in size; the inverse permutation
+        restores the caller's ordering.
+        """
+        order = np.argsort([-len(c) for c in contents], kind='stable')
+        sorted_contents = [contents[i] for i in order]
+        embeddings = self.embedding_model.encode(
+            sorted_contents, batch_size=32, show_progress_bar=False,
+            convert_to_numpy=True, normalize_embeddings=True
+        )
+        inverse = np.argsort(order, kind='stable')
+        return embeddings[inverse].astype(np.float32, copy=False)
+
+    def _cached_encode_batch(self, contents: List[str]) -> np.ndarray:
+        """Encode a batch, reusing embeddings other workers already computed.
+
+        Misses fall through to _encode_batch and are written back with a TTL;
+        a dead Redis degrades to plain encoding.
+        """
+        keys = [b'emb:' + hashlib.sha256(c.encode()).digest() for c in contents]
+        cached: List[Optional[np.ndarray]] = [None] * len(contents)
+        try:
+            for i, buf in enumerate(redis_client.mget(keys)):
+                if buf:
+                    cached[i] = np.frombuffer(buf, dtype=np.float32)
+        except Exception as e:
+            logger.warning('Redis embedding cache unavailable', error=str(e))
+
+        miss_idx = [i for i, emb in enumerate(cached) if emb is None]
+        if miss_idx:
+            fresh = self._encode_batch(
+                [contents[i][:_EMBED_WINDOW_CHARS] for i in miss_idx]
+            )
+            for row, i in enumerate(miss_idx):
+                cached[i] = fresh[row]
+            try:
+                with redis_client.pipeline(transaction=False) as pipe:
+                    for row, i in enumerate(miss_idx):
+                        pipe.setex(keys[i], _EMB_CACHE_TTL, fresh[row].tobytes())
+                    pipe.execute()
+            except Exception as e:
+                logger.warning('Redis embedding cache write failed', error=str(e))
+
+        return np.stack(cached)
+
+    def _existing_by_hash(self, collection, content_hashes: List[str]) -> Dict[str, str]:
+        """Map already-stored content hashes to their document ids."""
+        try:
+            existing = collection.get(
+                where={'content_hash': {'$in': content_hashes}},
+                include=['metadatas']
+            )
+            return {
+                meta['content_hash']: doc_id
+                for doc_id, meta in zip(existing['ids'], existing['metadatas'])
+            }
+        except Exception as e:
+            logger.warning('Content hash lookup failed', error=str(e))
+            return {}
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.get_running_loop().create_task(self._flusher())
+
+    async def _flusher(self) -> None:
+        """Drain the write queue every flush interval until it is empty."""
+        while self._pending_podcasts or self._pending_news:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all queued documents in one batch per collection."""
+        pending, self._pending_podcasts = self._pending_podcasts, []
+        if pending:
+            try:
+                doc_ids = await self.store_podcast_transcripts_batch(
+                    [data for data, _ in pending]
+                )
+                for (_, future), doc_id in zip(pending, doc_ids):
+                    if not future.done():
+                        future.set_result(doc_id)
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+
+        pending, self._pending_news = self._pending_news, []
+        if pending:
+            try:
+                doc_ids = await self.store_news_articles_batch(
+                    [data for data, _ in pending]
+                )
+                for (_, future), doc_id in zip(pending, doc_ids):
+                    if not future.done():
+                        future.set_result(doc_id)
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+
     async def store_podcast_transcript(self, podcast_data: Dict[str, Any]) -> str:
-        doc_id = str(uuid.uuid4())
-        team_name = podcast_data.get('team_name', '')
-        episode_title = podcast_data.get('episode_title', '')
-        transcript = podcast_data.get('transcript', '')
-        content = f'{team_name} {episode_title} {transcript}'
-        embedding = self.embedding_model.encode(content).tolist()
-        
-        metadata = {
-            'team_name': podcast_data.get('team_name', ''),
-            'episode_title': podcast_data.get('episode_title', ''),
-            'publish_date': podcast_data.get('publish_date', ''),
-            'duration': str(podcast_data.get('duration', '')),
-            'podcast_id': podcast_data.get('podcast_id', ''),
-            'episode_id': podcast_data.get('episode_id', ''),
-            'content_type': 'podcast',
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
+        future = asyncio.get_running_loop().create_future()
+        self._pending_podcasts.append((podcast_data, future))
+        if len(self._pending_podcasts) >= settings.podcast_batch_size:
+            await self.flush()
+        else:
+            self._ensure_flusher()
+        return await future
+
+    async def store_podcast_transcripts_batch(self, podcast_batch: List[Dict[str, Any]]) -> List[str]:
+        """Store several podcast transcripts with a single encode and add call."""
+        if not podcast_batch:
+            return []
+
+        contents = [
+            f"{p.get('team_name', '')} {p.get('episode_title', '')} {p.get('transcript', '')}"
+            for p in podcast_batch
+        ]
+        hashes = [hashlib.sha256(c.encode()).hexdigest() for c in contents]
+        existing = await asyncio.to_thread(self._existing_by_hash, self.podcast_collection, hashes)
+
+        # Only unseen content pays for an embedding
+        new_idx = [i for i, h in enumerate(hashes) if h not in existing]
+        doc_ids = [existing.get(h) or str(uuid.uuid4()) for h in hashes]
+        if not new_idx:
+            return doc_ids
+
+        new_contents = [contents[i] for i in new_idx]
+        # One batched forward pass instead of one per document
+        async with self._model_semaphore:
+            embeddings = await asyncio.to_thread(self._cached_encode_batch, new_contents)
+
+        # Epoch float is cheaper to produce and store; render with _iso on read
+        timestamp = time.time()
+        metadatas = []
+        for i in new_idx:
+            p = podcast_batch[i]
+            metadatas.append({
+                'team_name': p.get('team_name', ''),
+                'episode_title': p.get('episode_title', ''),
+                'publish_date': p.get('publish_date', ''),
+                'duration': _as_float(p.get('duration')),
+                'podcast_id': p.get('podcast_id', ''),
+                'episode_id': p.get('episode_id', ''),
+                'content_type': 'podcast',
+                'content_hash': hashes[i],
+                'timestamp': timestamp
+            })
+
+        # ChromaDB accepts the float32 matrix directly; no Python float boxing
+        new_ids = [doc_ids[i] for i in new_idx]
+        await asyncio.to_thread(
+            self.podcast_collection.add,
+            ids=new_ids,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            documents=new_contents
+        )
+        self._mirror_podcast_rows(new_ids, embeddings, new_contents, metadatas)
+
+        logger.info('Podcast transcripts stored in vector database',
+                    count=len(new_idx), deduplicated=len(podcast_batch) - len(new_idx))
+        return doc_ids
+
+    async def store_news_article(self, article_data: Dict[str, Any]) -> str:
+        future = asyncio.get_running_loop().create_future()
+        self._pending_news.append((article_data, future))
+        if len(self._pending_news) >= settings.podcast_batch_size:
+            await self.flush()
+        else:
+            self._ensure_flusher()
+        return await future
+
+    async def store_news_articles_batch(self, article_batch: List[Dict[str, Any]]) -> List[str]:
+        """Store several news articles with a single encode and add call."""
+        if not article_batch:
+            return []
 
-        self.podcast_collection.add(
-            ids=[doc_id],
-            embeddings=[embedding],
-            metadatas=[metadata],
-            documents=[content]
+        contents = [
+            f"{a.get('title', '')} {a.get('content', '')}"
+            for a in article_batch
+        ]
+        hashes = [hashlib.sha256(c.encode()).hexdigest() for c in contents]
+        existing = await asyncio.to_thread(self._existing_by_hash, self.news_collection, hashes)
+
+        new_idx = [i for i, h in enumerate(hashes) if h not in existing]
+        doc_ids = [existing.get(h) or str(uuid.uuid4()) for h in hashes]
+        if not new_idx:
+            return doc_ids
+
+        new_contents = [contents[i] for i in new_idx]
+        async with self._model_semaphore:
+            embeddings = await asyncio.to_thread(self._cached_encode_batch, new_contents)
+
+        timestamp = time.time()
+        metadatas = []
+        for i in new_idx:
+            a = article_batch[i]
+            metadatas.append({
+                'title': a.get('title', ''),
+                'source': a.get('source', ''),
+                'publish_date': a.get('publish_date', ''),
+                'sentiment_score': _as_float(a.get('sentiment_score')),
+                'content_type': 'news',
+                'content_hash': hashes[i],
+                'timestamp': timestamp
+            })
+
+        await asyncio.to_thread(
+            self.news_collection.add,
+            ids=[doc_ids[i] for i in new_idx],
+            embeddings=embeddings,
+            metadatas=metadatas,
+            documents=new_contents
         )
 
-        logger.info('Podcast transcript stored in vector database', doc_id=doc_id)
-        return doc_id
+        logger.info('News articles stored in vector database',
+                    count=len(new_idx), deduplicated=len(article_batch) - len(new_idx))
+        return doc_ids
 
     async def search_podcasts(self, query: str, limit: int = 5, team_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-        query_embedding = self.embedding_model.encode(query).tolist()
-        
+        # Both the encode and the ANN query are blocking C calls; keep them
+        # off the event loop so concurrent requests can overlap.
+        async with self._model_semaphore:
+            query_embedding = await asyncio.to_thread(self._encode_query, query)
+
+        cache_key = ('podcast', limit, team_filter)
+        cached, unit_embedding = self._semantic_cache_get(query_embedding, cache_key)
+        if cached is not None:
+            logger.info('Podcast search served from semantic cache', query=query)
+            return cached
+
+        # Unfiltered searches scan the in-process mirror with one matmul
+        if team_filter is None:
+            try:
+                formatted_results = await asyncio.to_thread(
+                    self._brute_force_podcast_search, unit_embedding, limit
+                )
+                self._semantic_cache_put(unit_embedding, cache_key, formatted_results)
+                logger.info('Podcast search completed', query=query,
+                            results_count=len(formatted_results))
+                return formatted_results
+            except Exception as e:
+                logger.warning('Brute-force podcast scan failed, using ChromaDB',
+                               error=str(e))
+
         where_clause = {'content_type': 'podcast'}
         if team_filter:
             where_clause['team_name'] = team_filter
 
-        results = self.podcast_collection.query(
-            query_embeddings=[query_embedding],
+        results = await asyncio.to_thread(
+            self.podcast_collection.query,
+            query_embeddings=query_embedding.reshape(1, -1),
+            n_results=limit,
+            where=where_clause
+        )
+
+        formatted_results = self._format_results(results)
+
+        self._semantic_cache_put(unit_embedding, cache_key, formatted_results)
+        logger.info('Podcast search completed', query=query, results_count=len(formatted_results))
+        return formatted_results
+
+    async def _search_with_embedding(self, collection, query_embedding: np.ndarray,
+                                     limit: int, where_clause: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Query a collection with an already-computed embedding and format results."""
+        results = await asyncio.to_thread(
+            collection.query,
+            query_embeddings=query_embedding.reshape(1, -1),
             n_results=limit,
             where=where_clause
         )
+        return self._format_results(results)
+
+    @staticmethod
+    def _format_results(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Flatten a ChromaDB query response into the API result shape."""
+        ids = results['ids'][0]
+        docs = results['documents'][0]
+        metas = results['metadatas'][0]
+        dists = results['distances'][0] if results.get('distances') else [0.0] * len(ids)
 
         formatted_results = []
-        for i, doc_id in enumerate(results['ids'][0]):
-            content = results['documents'][0][i]
-            preview = content[:500] + '...' if len(content) > 500 else content
+        for doc_id, doc, meta, dist in zip(ids, docs, metas, dists):
+            preview = doc[:500] + '...' if len(doc) > 500 else doc
             formatted_results.append({
                 'doc_id': doc_id,
                 'content': preview,
-                'metadata': results['metadatas'][0][i],
-                'similarity_score': 1.0 - (results['distances'][0][i] if 'distances' in results else 0.0)
+                'metadata': meta,
+                'similarity_score': 1.0 - dist
             })
+        return formatted_results
 
-        logger.info('Podcast search completed', query=query, results_count=len(formatted_results))
+    async def search_news(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        async with self._model_semaphore:
+            query_embedding = await asyncio.to_thread(self._encode_query, query)
+
+        formatted_results = await self._search_with_embedding(
+            self.news_collection, query_embedding, limit, {'content_type': 'news'}
+        )
+        logger.info('News search completed', query=query, results_count=len(formatted_results))
         return formatted_results
 
+    async def search_combined(self, query: str, limit: int = 5) -> Dict[str, Any]:
+        # Encode once, then fan out to both collections concurrently
+        async with self._model_semaphore:
+            query_embedding = await asyncio.to_thread(self._encode_query, query)
+
+        podcast_results, news_results = await asyncio.gather(
+            self._search_with_embedding(
+                self.podcast_collection, query_embedding, limit // 2,
+                {'content_type': 'podcast'}
+            ),
+            self._search_with_embedding(
+                self.news_collection, query_embedding, limit // 2,
+                {'content_type': 'news'}
+            )
+        )
+
+        return {
+            'query': query,
+            'total_results': len(podcast_results) + len(news_results),
+            'podcast_results': podcast_results,
+            'news_results': news_results,
+            'search_timestamp': datetime.now(timezone.utc).timestamp()
+        }
+
+    def _chunk_transcript(self, transcript: str, chunk_size: int = 1000) -> List[str]:
+        """Chunk transcript into smaller pieces for better search.
+
+        Slicing the original string by word offsets avoids materializing
+        every token and re-joining it, which is quadratic in joined bytes
+        on long transcripts.
+        """
+        spans = [match.span() for match in _WORD_RE.finditer(transcript)]
+        if not spans:
+            return [transcript]
+
+        chunks = []
+        for i in range(0, len(spans), chunk_size):
+            start = spans[i][0]
+            end = spans[min(i + chunk_size, len(spans)) - 1][1]
+            chunks.append(transcript[start:end])
+
+        return chunks
+
     async def get_collection_stats(self) -> Dict[str, Any]:
         try:
             podcast_count = self.podcast_collection.count()
@@ -107,7 +644,7 @@ class VectorDatabaseManager:
                     'name': 'news_sentiment'
                 },
                 'total_documents': podcast_count + news_count,
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': _iso(time.time())
             }
         except Exception as e:
             logger.error('Error getting collection stats', error=str(e))
@@ -1,3 +1,4 @@
+import functools
 import os
 from typing import Optional
 from pydantic_settings import BaseSettings
@@ -29,10 +30,13 @@ class Settings(BaseSettings):
     assemblyai_api_key: Optional[str] = Field(None, env="ASSEMBLYAI_API_KEY")
     vector_db_path: str = Field("./chroma_db", env="VECTOR_DB_PATH")
     podcast_batch_size: int = Field(5, env="PODCAST_BATCH_SIZE")
+    embedding_precision: str = Field("int8", env="EMBEDDING_PRECISION")
 
     environment: str = Field("development", env="ENVIRONMENT")
     debug: bool = Field(True, env="DEBUG")
     log_level: str = Field("INFO", env="LOG_LEVEL")
+    binary_logs: bool = Field(False, env="BINARY_LOGS")
+    log_site_map_path: str = Field("./log_sites.json", env="LOG_SITE_MAP_PATH")
     
     redis_url: str = Field("redis://localhost:6379", env="REDIS_URL")
     
@@ -47,10 +51,26 @@ class Settings(BaseSettings):
     
     salary_cap: int = Field(50000, env="SALARY_CAP")
     lineup_count: int = Field(150, env="LINEUP_COUNT")
+    max_live_adjustments: int = Field(1024, env="MAX_LIVE_ADJUSTMENTS")
+    performance_history_path: str = Field(
+        "./performance_history.parquet", env="PERFORMANCE_HISTORY_PATH"
+    )
+    model_lib_dir: str = Field("./compiled_models", env="MODEL_LIB_DIR")
     
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Single validated Settings instance per process.
+
+    Constructing Settings re-reads and re-validates the .env file, so
+    anything that needs its own handle should call this instead of
+    instantiating the class directly.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,11 +1,20 @@
+import functools
+
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from neo4j import GraphDatabase
 import redis
+import redis.asyncio
 from .config import settings
 
-engine = create_engine(settings.database_url)
+# pool_pre_ping avoids handing out connections managed Postgres has
+# silently dropped; recycle keeps them younger than common idle timeouts.
+_engine_kwargs = {"pool_pre_ping": True, "pool_recycle": 1800}
+if not settings.database_url.startswith("sqlite"):
+    # SQLite's pools don't take sizing arguments
+    _engine_kwargs.update(pool_size=20, max_overflow=40)
+engine = create_engine(settings.database_url, **_engine_kwargs)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 metadata = MetaData()
@@ -26,30 +35,46 @@ class Neo4jConnection:
             settings.neo4j_uri,
             auth=(settings.neo4j_user, settings.neo4j_password)
         )
-    
+
     def close(self):
         if self.driver:
             self.driver.close()
-    
+
     def query(self, query, parameters=None, db=None):
         assert self.driver is not None, "Driver not initialized!"
-        session = None
-        response = None
+        # The driver pools connections internally; a short-lived session
+        # per query just borrows one from the pool.
         try:
-            session = self.driver.session(database=db) if db is not None else self.driver.session()
-            response = list(session.run(query, parameters))
+            with self.driver.session(database=db) as session:
+                return list(session.run(query, parameters))
         except Exception as e:
             print(f"Query failed: {e}")
-        finally:
-            if session is not None:
-                session.close()
-        return response
+            return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_neo4j() -> Neo4jConnection:
+    """Lazy process-wide Neo4j connection.
+
+    Workers that never touch the knowledge graph (vector DB jobs, pure
+    API workers) no longer pay for driver construction at import time.
+    """
+    return Neo4jConnection()
 
 
-redis_client = redis.from_url(settings.redis_url)
+# Bounded pools so threaded callers don't serialize on one connection
+redis_pool = redis.ConnectionPool.from_url(settings.redis_url, max_connections=32)
+redis_client = redis.Redis(connection_pool=redis_pool)
+async_redis_pool = redis.asyncio.ConnectionPool.from_url(settings.redis_url, max_connections=32)
+async_redis_client = redis.asyncio.Redis(connection_pool=async_redis_pool)
 
 
-neo4j_conn = Neo4jConnection()
+def __getattr__(name):
+    # Keep `from shared.database import neo4j_conn` working while deferring
+    # driver construction to first use
+    if name == 'neo4j_conn':
+        return get_neo4j()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_database():
@@ -59,5 +84,6 @@ def init_database():
 
 def close_connections():
     """Close all database connections"""
-    neo4j_conn.close()
+    if get_neo4j.cache_info().currsize:
+        get_neo4j().close()
     redis_client.close()
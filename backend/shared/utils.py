@@ -1,11 +1,80 @@
+import atexit
+import functools
 import logging
+import orjson
 import structlog
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
-import pandas as pd
 import numpy as np
 from .config import settings
 
+try:
+    from numba import vectorize
+except ImportError:
+    vectorize = None
+
+# Interned log sites: with settings.binary_logs the renderer replaces the
+# repeated (logger, event) strings with a process-local integer id and
+# emits a compact positional array, cutting both serialization work and
+# payload size. The id -> template map is written out at exit so the
+# stream stays decodable offline.
+# Stack and exception rendering only matter on the error path (or when a
+# caller explicitly passes exc_info/stack_info); running the two
+# processors on every debug/info record puts them in the hot path for
+# nothing. One cheap dispatch replaces both calls on the fast path.
+_STACK_PROCESSORS = (
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+)
+_ERROR_METHODS = frozenset({"error", "critical", "exception"})
+
+
+def _render_stack_on_errors(logger, method_name, event_dict):
+    if (method_name in _ERROR_METHODS
+            or "exc_info" in event_dict or "stack_info" in event_dict):
+        for processor in _STACK_PROCESSORS:
+            event_dict = processor(logger, method_name, event_dict)
+    return event_dict
+
+
+_log_site_ids: Dict[tuple, int] = {}
+
+
+def _dump_log_site_map() -> None:
+    if not _log_site_ids:
+        return
+    try:
+        with open(settings.log_site_map_path, "wb") as fh:
+            fh.write(orjson.dumps(
+                {str(site_id): list(key) for key, site_id in _log_site_ids.items()}
+            ))
+    except OSError:
+        pass
+
+
+def _interned_renderer(logger, method_name, event_dict):
+    site_key = (event_dict.pop("logger", ""), event_dict.pop("event", ""))
+    site_id = _log_site_ids.get(site_key)
+    if site_id is None:
+        site_id = _log_site_ids[site_key] = len(_log_site_ids)
+    timestamp = event_dict.pop("timestamp", None)
+    level = event_dict.pop("level", method_name)
+    return orjson.dumps(
+        [site_id, timestamp, level, event_dict], default=str
+    ).decode()
+
+
+if settings.binary_logs:
+    atexit.register(_dump_log_site_map)
+    _renderer = _interned_renderer
+else:
+    # orjson serializes at C speed; stdlib json dominates emission cost
+    _renderer = structlog.processors.JSONRenderer(
+        serializer=lambda obj, **kw: orjson.dumps(obj, default=str).decode()
+    )
+
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
@@ -13,10 +82,9 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _render_stack_on_errors,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        _renderer,
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -27,72 +95,141 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
+def serialize_for_cache(obj: Any) -> bytes:
+    """Serialize an object to orjson bytes for Redis storage"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+
+
+SEASON_START = datetime(2025, 9, 4, tzinfo=timezone.utc)
+_SEASON_START_ORDINAL = SEASON_START.date().toordinal()
+
+
+@functools.lru_cache(maxsize=8)
+def _nfl_week_for_ordinal(ordinal: int) -> int:
+    days_since_start = ordinal - _SEASON_START_ORDINAL
+    if days_since_start < 0:
+        return 0  # Preseason
+    return min(days_since_start // 7 + 1, 18)  # Cap at 18 for regular season
+
+
 def get_current_nfl_week() -> int:
     """
     Determine the current NFL week based on the date.
     Returns 1-18 for regular season, 0 for preseason, 19+ for playoffs.
+
+    The week only changes with the UTC date, so the computation is
+    memoized per day rather than rebuilding datetimes on every call.
     """
-    now = datetime.now(timezone.utc)
-    
-    season_start = datetime(2025, 9, 4, tzinfo=timezone.utc)
-    
-    if now < season_start:
-        return 0  # Preseason
-    
-    days_since_start = (now - season_start).days
-    week = (days_since_start // 7) + 1
-    
-    return min(week, 18)  # Cap at 18 for regular season
+    return _nfl_week_for_ordinal(datetime.now(timezone.utc).date().toordinal())
 
 
-def is_low_data_mode() -> bool:
+def is_low_data_mode(current_week: Optional[int] = None) -> bool:
     """
     Determine if the system should operate in low-data mode.
-    Returns True for weeks 1-3 of the season.
+    Returns True for weeks 1-3 of the season. Callers in tight loops can
+    pass an already-computed week to skip the lookup.
     """
-    current_week = get_current_nfl_week()
+    if current_week is None:
+        current_week = get_current_nfl_week()
     return 1 <= current_week <= 3
 
 
+# DraftKings classic roster shape, hoisted so validation doesn't rebuild
+# them per call
+ROSTER_SIZE = 9
+FLEX_POSITIONS = frozenset({'RB', 'WR', 'TE'})
+REQ_MIN_COUNTS = {'QB': 1, 'RB': 2, 'WR': 3, 'TE': 1, 'DST': 1}
+
+# Int-coded positions for the SoA lineup path; code 5 buckets anything
+# unrecognised so bincount can reject it
+POSITION_CODES = {'QB': 0, 'RB': 1, 'WR': 2, 'TE': 3, 'DST': 4}
+_REQ_MIN_COUNT_VEC = np.array([1, 2, 3, 1, 1, 0], dtype=np.int64)
+_FLEX_CODE_SLICE = slice(1, 4)  # RB, WR, TE
+
+
+@dataclass
+class Lineup:
+    """Structure-of-arrays lineup: parallel salary and position arrays.
+
+    Built once at slate-load time so validation and scoring touch two
+    contiguous arrays instead of a list of per-player dicts.
+    """
+
+    salaries: np.ndarray  # int32[N]
+    position_codes: np.ndarray  # int8[N], values from POSITION_CODES
+
+    @classmethod
+    def from_players(cls, players: list) -> "Lineup":
+        """Build from the legacy list-of-dicts player representation"""
+        n = len(players)
+        salaries = np.fromiter(
+            (player.get('salary', 0) for player in players),
+            dtype=np.int32, count=n
+        )
+        codes = np.fromiter(
+            (POSITION_CODES.get(player.get('position'), 5) for player in players),
+            dtype=np.int8, count=n
+        )
+        return cls(salaries=salaries, position_codes=codes)
+
+    def is_valid(self, salary_cap: Optional[int] = None) -> bool:
+        """Validate roster shape and salary with no per-player Python work"""
+        if self.salaries.shape[0] != ROSTER_SIZE:
+            return False
+        if int(self.salaries.sum()) > (salary_cap or settings.salary_cap):
+            return False
+        counts = np.bincount(self.position_codes, minlength=6)
+        if counts[5] != 0 or not (counts >= _REQ_MIN_COUNT_VEC).all():
+            return False
+        # QB/DST are exact slots; the FLEX slot is one extra RB/WR/TE
+        return (counts[POSITION_CODES['QB']] == 1
+                and counts[POSITION_CODES['DST']] == 1
+                and int(counts[_FLEX_CODE_SLICE].sum()) == ROSTER_SIZE - 2)
+
+
 def validate_lineup(lineup: Dict[str, Any]) -> bool:
     """
     Validate that a lineup meets DFS constraints.
-    
+
     Args:
         lineup: Dictionary containing player selections and metadata
-        
+
     Returns:
         bool: True if lineup is valid, False otherwise
     """
     try:
-        total_salary = sum(player.get('salary', 0) for player in lineup.get('players', []))
+        if isinstance(lineup, Lineup):
+            return lineup.is_valid()
+
+        players = lineup.get('players', [])
+        # Wrong roster size can never validate; bail before touching
+        # salaries or positions
+        if len(players) != ROSTER_SIZE:
+            logger.warning("Invalid lineup size", players=len(players))
+            return False
+
+        salaries = np.fromiter(
+            (player.get('salary', 0) for player in players),
+            dtype=np.int64, count=len(players)
+        )
+        total_salary = int(salaries.sum())
         if total_salary > settings.salary_cap:
             logger.warning("Lineup exceeds salary cap", total_salary=total_salary)
             return False
-        
-        positions = [player.get('position') for player in lineup.get('players', [])]
-        required_positions = {
-            'QB': 1, 'RB': 2, 'WR': 3, 'TE': 1, 'DST': 1, 'FLEX': 1
-        }
-        
-        position_counts = {}
-        for pos in positions:
-            if pos in ['RB', 'WR', 'TE'] and position_counts.get('FLEX', 0) == 0:
-                if position_counts.get(pos, 0) < required_positions.get(pos, 0):
-                    position_counts[pos] = position_counts.get(pos, 0) + 1
-                else:
-                    position_counts['FLEX'] = 1
-            else:
-                position_counts[pos] = position_counts.get(pos, 0) + 1
-        
-        for pos, required in required_positions.items():
-            if position_counts.get(pos, 0) != required:
-                logger.warning("Invalid position count", position=pos, 
-                             required=required, actual=position_counts.get(pos, 0))
-                return False
-        
+
+        # Counting positions once replaces the per-player FLEX state machine:
+        # QB/DST are exact, the FLEX slot is exactly one extra RB/WR/TE
+        counts = Counter(player.get('position') for player in players)
+        flex_pool = sum(counts[pos] for pos in FLEX_POSITIONS)
+        if (counts['QB'] != REQ_MIN_COUNTS['QB']
+                or counts['DST'] != REQ_MIN_COUNTS['DST']
+                or any(counts[pos] < REQ_MIN_COUNTS[pos] for pos in FLEX_POSITIONS)
+                or flex_pool != ROSTER_SIZE - 2):
+            logger.warning("Invalid position counts", counts=dict(counts))
+            return False
+
         return True
-        
+
     except Exception as e:
         logger.error("Error validating lineup", error=str(e))
         return False
@@ -111,10 +248,36 @@ def calculate_leverage_score(player_ceiling: float, player_ownership: float) ->
     """
     if player_ownership <= 0:
         return 0.0
-    
+
     return player_ceiling / (player_ownership / 100.0)
 
 
+def calculate_leverage_scores(ceilings: np.ndarray, ownerships: np.ndarray) -> np.ndarray:
+    """
+    Calculate leverage scores for whole player pools in one vectorized pass.
+
+    Matches calculate_leverage_score elementwise: non-positive ownership
+    maps to 0.0 instead of inf/nan.
+
+    Args:
+        ceilings: Players' ceiling projections
+        ownerships: Players' projected ownership percentages
+
+    Returns:
+        np.ndarray: Leverage scores (ceiling / ownership fraction)
+    """
+    ceilings = np.asarray(ceilings, dtype=np.float64)
+    ownerships = np.asarray(ownerships, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.where(ownerships > 0, ceilings / (ownerships / 100.0), 0.0)
+    return np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+# The scalar helpers below stay fully PEP 484-annotated with concrete
+# float/str types so an ahead-of-time compiler (mypyc/Cython) can lower
+# them to C doubles unchanged if a compiled build is ever added; until
+# then the hot loops route through the numpy/numba vectorized variants
+# above instead of calling these per element.
 def format_currency(amount: float) -> str:
     """Format amount as currency string"""
     return f"${amount:,.2f}"
@@ -132,39 +295,87 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
     return numerator / denominator
 
 
-def exponential_decay_weight(weeks_ago: int, decay_factor: float = 0.9) -> float:
+if vectorize is not None:
+    @vectorize(['float64(int64, float64)'], nopython=True, fastmath=True, cache=True)
+    def _decay_ufunc(weeks_ago, decay_factor):
+        return decay_factor ** weeks_ago
+
+    # Warm the JIT so the first feature-construction call doesn't pay for
+    # compilation; cache=True persists the machine code across processes
+    _decay_ufunc(np.zeros(1, dtype=np.int64), 0.9)
+else:
+    _decay_ufunc = None
+
+
+def exponential_decay_weight(weeks_ago, decay_factor: float = 0.9):
     """
     Calculate exponential decay weight for historical data.
-    
+
+    Accepts a scalar or an array of week offsets; arrays compute in a
+    single vectorized pass.
+
     Args:
-        weeks_ago: Number of weeks in the past
+        weeks_ago: Number of weeks in the past (int or ndarray)
         decay_factor: Decay factor (0-1, closer to 1 means slower decay)
-        
+
     Returns:
-        float: Weight to apply to historical data
+        float or ndarray: Weight to apply to historical data
     """
+    if isinstance(weeks_ago, np.ndarray):
+        weeks = weeks_ago.astype(np.int64, copy=False)
+        if _decay_ufunc is not None:
+            return _decay_ufunc(weeks, decay_factor)
+        return np.power(decay_factor, weeks)
     return decay_factor ** weeks_ago
 
 
+@functools.lru_cache(maxsize=8192)
+def normalize_player_name(name: str) -> str:
+    """Normalize player name for consistent matching.
+
+    A slate mentions the same few hundred names thousands of times across
+    feeds, so results are memoized; 8192 entries comfortably covers a
+    full season's player pool.
+    """
+    return name.strip().title().replace(".", "").replace("'", "")
+
+
 class DataProcessor:
     """Utility class for common data processing operations"""
-    
-    @staticmethod
-    def normalize_player_name(name: str) -> str:
-        """Normalize player name for consistent matching"""
-        return name.strip().title().replace(".", "").replace("'", "")
-    
+
+    normalize_player_name = staticmethod(normalize_player_name)
+
     @staticmethod
     def calculate_z_score(value: float, mean: float, std: float) -> float:
         """Calculate z-score for a value"""
         if std == 0:
             return 0.0
         return (value - mean) / std
+
+    @staticmethod
+    def calculate_z_score_array(values: np.ndarray, mean, std) -> np.ndarray:
+        """Calculate z-scores for an array of values in one vectorized pass.
+
+        `mean` and `std` may be scalars or arrays broadcastable against
+        `values`; positions where std is zero come back as 0.0 rather
+        than inf/nan.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        std = np.asarray(std, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(std == 0, 0.0, (values - mean) / std)
     
     @staticmethod
-    def winsorize(data: pd.Series, lower_percentile: float = 0.05, 
-                  upper_percentile: float = 0.95) -> pd.Series:
+    def winsorize(data: "pd.Series", lower_percentile: float = 0.05,
+                  upper_percentile: float = 0.95) -> "pd.Series":
         """Winsorize data to handle outliers"""
-        lower_bound = data.quantile(lower_percentile)
-        upper_bound = data.quantile(upper_percentile)
-        return data.clip(lower=lower_bound, upper=upper_bound)
+        # Deferred so importers of utils that never touch pandas don't pay
+        # its import cost at startup
+        import pandas as pd
+
+        # One quantile call partitions the data once for both bounds
+        bounds = data.quantile([lower_percentile, upper_percentile])
+        return pd.Series(
+            np.clip(data.to_numpy(copy=False), bounds.iat[0], bounds.iat[1]),
+            index=data.index, name=data.name
+        )
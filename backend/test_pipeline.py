@@ -1,5 +1,6 @@
 import asyncio
-import json
+import orjson
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 import structlog
 
@@ -44,21 +45,28 @@ async def verify_pipeline():
     # Verify Redis Storage (Player data, RSS articles, etc.)
     logger.info("Verifying Redis storage...")
     try:
-        player_keys = redis_client.keys("player:*")
-        rss_keys = redis_client.keys("rss_article:*")
-        dfs_player_keys = redis_client.keys("dfs_player:*")
-        
-        verification_results["redis"]["found_keys"] = len(player_keys) + len(rss_keys) + len(dfs_player_keys)
-        
+        # SCAN iterates in bounded chunks instead of blocking the Redis
+        # event loop like KEYS; the three counts run concurrently.
+        def count_keys(pattern: str) -> int:
+            return sum(1 for _ in redis_client.scan_iter(match=pattern, count=1000))
+
+        player_key_count, rss_key_count, dfs_key_count = await asyncio.gather(
+            asyncio.to_thread(count_keys, "player:*"),
+            asyncio.to_thread(count_keys, "rss_article:*"),
+            asyncio.to_thread(count_keys, "dfs_player:*"),
+        )
+
+        verification_results["redis"]["found_keys"] = player_key_count + rss_key_count + dfs_key_count
+
         ingested_players = ingestion_summary.get('player_stats', {}).get('players_count', 0)
         ingested_articles = ingestion_summary.get('rss_feeds', {}).get('total_articles', 0)
         ingested_dfs_players = ingestion_summary.get('dfs_data', {}).get('players_count', 0)
         verification_results["redis"]["total_keys_expected"] = ingested_players + ingested_articles + ingested_dfs_players
 
-        logger.info("Redis verification complete.", 
-                    found_player_keys=len(player_keys),
-                    found_rss_keys=len(rss_keys),
-                    found_dfs_keys=len(dfs_player_keys))
+        logger.info("Redis verification complete.",
+                    found_player_keys=player_key_count,
+                    found_rss_keys=rss_key_count,
+                    found_dfs_keys=dfs_key_count)
     except Exception as e:
         logger.error("Failed to verify Redis storage", error=str(e))
 
@@ -66,10 +74,15 @@ async def verify_pipeline():
     logger.info("Verifying PostgreSQL storage...")
     db: Session = next(get_db())
     try:
-        player_count = db.query(Player).count()
-        game_count = db.query(Game).count()
-        news_count = db.query(NewsArticle).count()
-        
+        # One round-trip for all three tables instead of three separate
+        # SELECT COUNT(*) queries
+        player_count, game_count, news_count = db.execute(select(
+            select(func.count(Player.id)).scalar_subquery(),
+            select(func.count(Game.id)).scalar_subquery(),
+            select(func.count(NewsArticle.id)).scalar_subquery(),
+        )).one()
+
+
         verification_results["postgres"]["players"] = player_count
         verification_results["postgres"]["games"] = game_count
         verification_results["postgres"]["news_articles"] = news_count
@@ -85,9 +98,9 @@ async def verify_pipeline():
     print(f"Timestamp: {datetime.now(timezone.utc).isoformat()}\n")
 
     print("--- Ingestion Summary ---")
-    print(json.dumps(ingestion_summary, indent=2, default=str))
+    print(orjson.dumps(ingestion_summary, option=orjson.OPT_INDENT_2, default=str).decode())
     print("\n--- Storage Verification ---")
-    print(json.dumps(verification_results, indent=2, default=str))
+    print(orjson.dumps(verification_results, option=orjson.OPT_INDENT_2, default=str).decode())
     
     redis_ok = verification_results["redis"]["found_keys"] > 0 and verification_results["redis"]["found_keys"] >= verification_results["redis"]["total_keys_expected"]
     postgres_ok = verification_results["postgres"]["players"] > 0
@@ -3,29 +3,35 @@
 Final Readiness Verification for ATHENA v2.2
 """
 
-import requests
-import json
+import asyncio
 import time
 
+import httpx
+import orjson
+
 BASE_URL = "http://localhost:8000"
 
-def test_endpoint(name, url, method="GET", data=None):
+async def test_endpoint(client, name, url, method="GET", data=None):
     """Test an endpoint and return results"""
-    start_time = time.time()
+    # perf_counter_ns is monotonic and immune to NTP/clock steps, unlike
+    # time.time(); downstream stats stay in float seconds
+    start_ns = time.perf_counter_ns()
     try:
         if method == "POST":
-            response = requests.post(url, json=data, timeout=10)
+            response = await client.post(url, json=data)
         else:
-            response = requests.get(url, timeout=10)
+            response = await client.get(url)
 
-        response_time = time.time() - start_time
+        response_time = (time.perf_counter_ns() - start_ns) / 1e9
         success = response.status_code == 200
 
         print(f"🔍 {name}: {'✅' if success else '❌'} ({response_time:.3f}s)")
 
         if success:
             try:
-                return True, response.json(), response_time
+                # orjson parses the raw bytes directly, skipping httpx's
+                # charset sniffing and the stdlib decoder
+                return True, orjson.loads(response.content), response_time
             except:
                 return True, response.text, response_time
         else:
@@ -33,34 +39,41 @@ def test_endpoint(name, url, method="GET", data=None):
             return False, response.text, response_time
 
     except Exception as e:
-        response_time = time.time() - start_time
+        response_time = (time.perf_counter_ns() - start_ns) / 1e9
         print(f"🔍 {name}: ❌ ({response_time:.3f}s) - {str(e)}")
         return False, str(e), response_time
 
+async def run_tests():
+    """Run all endpoint tests concurrently over one pooled connection"""
+    chat_data = {"query": "What do the podcasts say about Patrick Mahomes?"}
+    tests = [
+        ("health", "Basic Health", "/health", "GET", None),
+        ("detailed_health", "Detailed Health", "/api/v1/health/detailed", "GET", None),
+        ("api_config", "API Configuration", "/api/v1/health/apis", "GET", None),
+        ("databases", "Database Health", "/api/v1/health/databases", "GET", None),
+        ("podcast_ingestion", "Podcast Data Ingestion",
+         "/api/v1/data/ingest?data_type=podcast_data", "POST", None),
+        ("chat_query", "Chat Intelligence", "/api/v1/chat/query", "POST", chat_data),
+    ]
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+    ) as client:
+        outcomes = await asyncio.gather(*[
+            test_endpoint(client, name, url, method, data)
+            for _, name, url, method, data in tests
+        ])
+
+    return dict(zip((key for key, *_ in tests), outcomes))
+
 def main():
     print("🎯 ATHENA v2.2 FINAL READINESS VERIFICATION")
     print("=" * 50)
 
-    results = {}
-
-    # Core System Tests
-    print("\n🏗️  CORE SYSTEM")
-    results["health"] = test_endpoint("Basic Health", f"{BASE_URL}/health")
-    results["detailed_health"] = test_endpoint("Detailed Health", f"{BASE_URL}/api/v1/health/detailed")
-    results["api_config"] = test_endpoint("API Configuration", f"{BASE_URL}/api/v1/health/apis")
-    results["databases"] = test_endpoint("Database Health", f"{BASE_URL}/api/v1/health/databases")
-
-    # Data Pipeline Tests
-    print("\n📊 DATA PIPELINE")
-    results["podcast_ingestion"] = test_endpoint("Podcast Data Ingestion",
-                                                f"{BASE_URL}/api/v1/data/ingest?data_type=podcast_data",
-                                                method="POST")
-
-    # Intelligence Tests
-    print("\n🧠 INTELLIGENCE SYSTEMS")
-    chat_data = {"query": "What do the podcasts say about Patrick Mahomes?"}
-    results["chat_query"] = test_endpoint("Chat Intelligence", f"{BASE_URL}/api/v1/chat/query",
-                                         method="POST", data=chat_data)
+    print("\n🏗️  CORE SYSTEM / 📊 DATA PIPELINE / 🧠 INTELLIGENCE SYSTEMS")
+    results = asyncio.run(run_tests())
 
     # Analysis
     print("\n📈 ANALYSIS")